@@ -1,4 +1,4 @@
-import json
+import orjson
 import streamlit as st
 from datetime import date, datetime
 from copy import deepcopy
@@ -9,9 +9,15 @@ from pathlib import Path
 # Define where your example bundles are stored
 bundle_path = Path("ch_elm_bundles") / "LB_beispiel_Gonorrhoe.json"
 
-# Load your base example as a template
-with open(bundle_path, "r", encoding="utf-8") as f:
-    template = json.load(f)
+
+@st.cache_data
+def _load_template(path: str, mtime: float) -> dict:
+    """Parse the template once per file version; Streamlit reruns the script on every widget change."""
+    return orjson.loads(Path(path).read_bytes())
+
+
+# Load your base example as a template (never mutate it - deepcopy on submit)
+template = _load_template(str(bundle_path), bundle_path.stat().st_mtime)
 
 st.title("FHIR Meldung Generator (CH-ELM)")
 
@@ -34,33 +40,35 @@ obs_date = st.date_input("Analysedatum", date.today())
 if st.button("Generate JSON"):
     bundle = deepcopy(template)
 
-    # --- Update Patient ---
+    # Index resources by type in a single pass over the entries
+    by_type = {}
     for entry in bundle["entry"]:
-        if entry["resource"]["resourceType"] == "Patient":
-            patient = entry["resource"]
-            patient["id"] = pat_id
-            patient["name"][0]["family"] = pat_family
-            patient["name"][0]["given"] = [pat_given]
-            patient["gender"] = pat_gender
-            patient["birthDate"] = pat_birth.isoformat()
-            patient["address"][0]["city"] = pat_city
-            patient["address"][0]["postalCode"] = pat_postcode
-            patient["address"][0]["state"] = pat_canton
+        resource = entry["resource"]
+        by_type.setdefault(resource["resourceType"], []).append(resource)
+
+    # --- Update Patient ---
+    for patient in by_type.get("Patient", []):
+        patient["id"] = pat_id
+        patient["name"][0]["family"] = pat_family
+        patient["name"][0]["given"] = [pat_given]
+        patient["gender"] = pat_gender
+        patient["birthDate"] = pat_birth.isoformat()
+        patient["address"][0]["city"] = pat_city
+        patient["address"][0]["postalCode"] = pat_postcode
+        patient["address"][0]["state"] = pat_canton
 
     # --- Update Observation ---
-    for entry in bundle["entry"]:
-        if entry["resource"]["resourceType"] == "Observation":
-            obs = entry["resource"]
-            obs["effectiveDateTime"] = obs_date.isoformat()
-            obs["code"]["coding"][0]["code"] = obs_code
-            obs["code"]["coding"][0]["display"] = obs_display
-            obs["valueCodeableConcept"]["coding"][0]["display"] = obs_value
-            if obs_value.lower() == "positive":
-                obs["interpretation"][0]["coding"][0]["code"] = "POS"
-            elif obs_value.lower() == "negative":
-                obs["interpretation"][0]["coding"][0]["code"] = "NEG"
-            else:
-                obs["interpretation"][0]["coding"][0]["code"] = "IND"
+    for obs in by_type.get("Observation", []):
+        obs["effectiveDateTime"] = obs_date.isoformat()
+        obs["code"]["coding"][0]["code"] = obs_code
+        obs["code"]["coding"][0]["display"] = obs_display
+        obs["valueCodeableConcept"]["coding"][0]["display"] = obs_value
+        if obs_value.lower() == "positive":
+            obs["interpretation"][0]["coding"][0]["code"] = "POS"
+        elif obs_value.lower() == "negative":
+            obs["interpretation"][0]["coding"][0]["code"] = "NEG"
+        else:
+            obs["interpretation"][0]["coding"][0]["code"] = "IND"
 
     # --- Update timestamp ---
     bundle["timestamp"] = datetime.now().isoformat()
@@ -69,67 +77,21 @@ if st.button("Generate JSON"):
     file_name = f"FHIR_Meldung_{pat_id}.json"
     output_path = Path("ch_elm_bundles") / file_name
 
+    # Serialize once (orjson emits UTF-8 directly) and reuse for file and download
+    payload = orjson.dumps(bundle, option=orjson.OPT_INDENT_2)
+
     # Write file to ch_elm_bundles folder
-    with open(output_path, "w", encoding="utf-8") as out:
-        json.dump(bundle, out, indent=2, ensure_ascii=False)
+    output_path.write_bytes(payload)
 
     st.success(f"FHIR Meldung gespeichert unter: {output_path}")
 
     # Offer browser download too
-    json_str = json.dumps(bundle, indent=2, ensure_ascii=False)
     st.download_button(
         label="⬇️ Download FHIR Meldung JSON",
-        data=json_str,
+        data=payload,
         file_name=file_name,
         mime="application/json",
         key=f"download_{pat_id}"
     )
 
     st.json(bundle)
-
-    bundle = deepcopy(template)
-
-    # --- Update Patient ---
-    for entry in bundle["entry"]:
-        if entry["resource"]["resourceType"] == "Patient":
-            patient = entry["resource"]
-            patient["id"] = pat_id
-            patient["name"][0]["family"] = pat_family
-            patient["name"][0]["given"] = [pat_given]
-            patient["gender"] = pat_gender
-            patient["birthDate"] = pat_birth.isoformat()
-            patient["address"][0]["city"] = pat_city
-            patient["address"][0]["postalCode"] = pat_postcode
-            patient["address"][0]["state"] = pat_canton
-
-    # --- Update Observation ---
-    for entry in bundle["entry"]:
-        if entry["resource"]["resourceType"] == "Observation":
-            obs = entry["resource"]
-            obs["effectiveDateTime"] = obs_date.isoformat()
-            obs["code"]["coding"][0]["code"] = obs_code
-            obs["code"]["coding"][0]["display"] = obs_display
-            obs["valueCodeableConcept"]["coding"][0]["display"] = obs_value
-            if obs_value.lower() == "positive":
-                obs["interpretation"][0]["coding"][0]["code"] = "POS"
-            elif obs_value.lower() == "negative":
-                obs["interpretation"][0]["coding"][0]["code"] = "NEG"
-            else:
-                obs["interpretation"][0]["coding"][0]["code"] = "IND"
-
-    # Update timestamp
-    bundle["timestamp"] = datetime.now().isoformat()
-
-    # Output
-    json_str = json.dumps(bundle, indent=2, ensure_ascii=False)
-    st.download_button(
-        label="⬇️ Download FHIR Meldung JSON",
-        data=json_str,
-        file_name=f"FHIR_Meldung_{pat_id}.json",
-        mime="application/json"
-    )
-
-    st.success("FHIR Meldung erfolgreich erstellt!")
-    st.json(bundle)
-
-
@@ -1,4 +1,4 @@
-import json
+import orjson
 import streamlit as st
 from datetime import date, datetime
 from pathlib import Path
@@ -7,10 +7,16 @@ from copy import deepcopy
 # Define the base example location
 bundle_path = Path("ch_elm_bundles") / "KB_beispiel_Gonorrhoe.json"
 
-# Try loading the base template
+
+@st.cache_data
+def _load_template(path: str, mtime: float) -> dict:
+    """Parse the template once per file version; Streamlit reruns the script on every widget change."""
+    return orjson.loads(Path(path).read_bytes())
+
+
+# Try loading the base template (never mutate it - deepcopy on submit)
 try:
-    with open(bundle_path, "r", encoding="utf-8") as f:
-        template = json.load(f)
+    template = _load_template(str(bundle_path), bundle_path.stat().st_mtime)
 except FileNotFoundError:
     st.error(f"Template file not found: {bundle_path}")
     st.stop()
@@ -42,31 +48,33 @@ cond_evidence_code = st.text_input("Befunde (SNOMED Code)", "31822004")
 if st.button("Generate JSON"):
     bundle = deepcopy(template)
 
-    # --- Update Patient ---
+    # Index resources by type in a single pass over the entries
+    by_type = {}
     for entry in bundle["entry"]:
-        if entry.get("resource", {}).get("resourceType") == "Patient":
-            patient = entry["resource"]
-            patient["id"] = pat_id
-            patient["name"][0]["family"] = pat_family
-            patient["name"][0]["given"] = [pat_given]
-            patient["gender"] = pat_gender
-            patient["birthDate"] = pat_birth.isoformat()
-            patient["address"][0]["city"] = pat_city
-            patient["address"][0]["postalCode"] = pat_postcode
-            patient["address"][0]["state"] = pat_canton
+        resource = entry.get("resource", {})
+        by_type.setdefault(resource.get("resourceType"), []).append(resource)
+
+    # --- Update Patient ---
+    for patient in by_type.get("Patient", []):
+        patient["id"] = pat_id
+        patient["name"][0]["family"] = pat_family
+        patient["name"][0]["given"] = [pat_given]
+        patient["gender"] = pat_gender
+        patient["birthDate"] = pat_birth.isoformat()
+        patient["address"][0]["city"] = pat_city
+        patient["address"][0]["postalCode"] = pat_postcode
+        patient["address"][0]["state"] = pat_canton
 
     # --- Update Condition ---
-    for entry in bundle["entry"]:
-        if entry.get("resource", {}).get("resourceType") == "Condition":
-            cond = entry["resource"]
-            cond["code"]["coding"][0]["code"] = cond_code
-            cond["code"]["coding"][0]["display"] = cond_display
-            cond["clinicalStatus"]["coding"][0]["code"] = cond_status
-            cond["verificationStatus"]["coding"][0]["code"] = cond_confirm
-            cond["onsetDateTime"] = cond_onset.isoformat()
-            cond["evidence"][0]["code"][0]["coding"][0]["display"] = cond_evidence
-            cond["evidence"][0]["code"][0]["coding"][0]["code"] = cond_evidence_code
-            cond["subject"]["reference"] = f"Patient/{pat_id}"
+    for cond in by_type.get("Condition", []):
+        cond["code"]["coding"][0]["code"] = cond_code
+        cond["code"]["coding"][0]["display"] = cond_display
+        cond["clinicalStatus"]["coding"][0]["code"] = cond_status
+        cond["verificationStatus"]["coding"][0]["code"] = cond_confirm
+        cond["onsetDateTime"] = cond_onset.isoformat()
+        cond["evidence"][0]["code"][0]["coding"][0]["display"] = cond_evidence
+        cond["evidence"][0]["code"][0]["coding"][0]["code"] = cond_evidence_code
+        cond["subject"]["reference"] = f"Patient/{pat_id}"
 
     # --- Update timestamp ---
     bundle["timestamp"] = datetime.now().isoformat()
@@ -76,17 +84,18 @@ if st.button("Generate JSON"):
     output_path = Path("ch_elm_bundles") / file_name
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Serialize once (orjson emits UTF-8 directly) and reuse for file and download
+    payload = orjson.dumps(bundle, option=orjson.OPT_INDENT_2)
+
     # --- Save locally ---
-    with open(output_path, "w", encoding="utf-8") as out:
-        json.dump(bundle, out, indent=2, ensure_ascii=False)
+    output_path.write_bytes(payload)
 
     st.success(f"FHIR Meldung gespeichert unter: {output_path}")
 
     # --- Provide download button ---
-    json_str = json.dumps(bundle, indent=2, ensure_ascii=False)
     st.download_button(
         label="⬇️ Download FHIR Meldung JSON",
-        data=json_str,
+        data=payload,
         file_name=file_name,
         mime="application/json",
         key=f"download_{pat_id}"
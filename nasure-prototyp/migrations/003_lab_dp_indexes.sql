@@ -0,0 +1,5 @@
+-- Migration 003: Composite index on the metrics read model per product and pathogen
+-- (kept in sync with the Index() declarations in lab_dp/adapters/orm.py)
+
+CREATE INDEX IF NOT EXISTS idx_metrics_product_pathogen
+    ON metrics(product_id, pathogen_code);
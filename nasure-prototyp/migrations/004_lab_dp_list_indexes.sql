@@ -0,0 +1,12 @@
+-- Migration 004: Indexes for the paginated data product list endpoints
+-- (kept in sync with the Index() declarations in lab_dp/adapters/orm.py)
+-- Each list query filters on a column prefix and orders by timestamp DESC.
+
+CREATE INDEX IF NOT EXISTS idx_products_timestamp
+    ON products(timestamp);
+
+CREATE INDEX IF NOT EXISTS idx_products_pathogen_timestamp
+    ON products(pathogen_code, timestamp);
+
+CREATE INDEX IF NOT EXISTS idx_products_patient_pathogen_timestamp
+    ON products(patient_id, pathogen_code, timestamp);
@@ -0,0 +1,27 @@
+-- Migration 005: Indexes for the case repository lookups
+-- (kept in sync with the Index() declarations in case/adapters/orm.py)
+-- metadata.create_all() only creates missing tables, so existing databases
+-- need these indexes added explicitly.
+
+CREATE TABLE IF NOT EXISTS cases (
+    case_id SERIAL PRIMARY KEY,
+    patient_id VARCHAR(255) NOT NULL,
+    case_date VARCHAR(255),
+    case_class VARCHAR(255),
+    case_status VARCHAR(255),
+    pathogen VARCHAR(255),
+    canton VARCHAR(2)
+);
+
+CREATE TABLE IF NOT EXISTS case_to_products (
+    id SERIAL PRIMARY KEY,
+    case_id VARCHAR(255) NOT NULL,
+    product_id VARCHAR(255) NOT NULL
+);
+
+-- Patient/pathogen lookups with the case_date range of the date window
+CREATE INDEX IF NOT EXISTS ix_cases_patient_pathogen_date
+    ON cases(patient_id, pathogen, case_date);
+
+CREATE INDEX IF NOT EXISTS ix_c2p_case_id
+    ON case_to_products(case_id);
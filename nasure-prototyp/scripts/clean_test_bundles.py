@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Clean MinIO test bucket.
+Clean MinIO test bucket and the Redis bundle index.
 
 Usage:
     python scripts/dev_cleanup.py
@@ -13,8 +13,10 @@ sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 try:
     from minio import Minio
-    from minio.error import S3Error
-    from config import get_minio_config
+    from minio.deleteobjects import DeleteObject
+    from redis import Redis
+    from config import get_minio_config, get_redis_host_and_port
+    from fhir_ingestion.adapters.repository import BUNDLE_INDEX_KEY
 except ImportError as e:
     print(f"Missing dependencies: {e}")
     print("Make sure you have installed the requirements:")
@@ -41,30 +43,56 @@ def clean_minio_bucket() -> bool:
             print(f"Bucket '{bucket_name}' doesn't exist - nothing to clean")
             return True
 
-        objects = list(minio_client.list_objects(bucket_name, recursive=True))
+        listed = 0
 
-        if not objects:
+        def objects_to_delete():
+            # Stream the listing straight into the batched delete
+            nonlocal listed
+            for obj in minio_client.list_objects(bucket_name, recursive=True):
+                listed += 1
+                yield DeleteObject(obj.object_name)
+
+        # remove_objects is lazy: iterating the errors sends the multi-object
+        # DELETE requests (up to 1000 keys each)
+        failed = 0
+        for error in minio_client.remove_objects(bucket_name, objects_to_delete()):
+            failed += 1
+            print(f"Failed to delete {error.name}: {error.message}")
+
+        if not listed:
             print("Bucket is already empty")
             return True
 
-        print(f"Deleting {len(objects)} objects...")
+        print(f"Deleted {listed - failed} objects from MinIO bucket")
+        return True
 
-        for obj in objects:
-            try:
-                minio_client.remove_object(bucket_name, obj.object_name)
-            except S3Error as e:
-                print(f"Failed to delete {obj.object_name}: {e}")
+    except Exception as e:
+        print(f"MinIO cleanup failed: {e}")
+        return False
 
-        print(f"Deleted {len(objects)} objects from MinIO bucket")
+
+def clean_bundle_index() -> bool:
+    """Drop the Redis bundle_id -> object_key index, which would point at deleted objects."""
+    try:
+        redis_client = Redis(**get_redis_host_and_port())
+        print(f"Cleaning Redis bundle index '{BUNDLE_INDEX_KEY}'...")
+
+        entries = redis_client.hlen(BUNDLE_INDEX_KEY)
+        redis_client.delete(BUNDLE_INDEX_KEY)
+
+        print(f"Deleted {entries} entries from Redis bundle index")
         return True
 
     except Exception as e:
-        print(f"MinIO cleanup failed: {e}")
+        print(f"Redis index cleanup failed: {e}")
         return False
 
 
 def main():
-    if clean_minio_bucket():
+    # Run both steps even if the first one fails
+    bucket_cleaned = clean_minio_bucket()
+    index_cleaned = clean_bundle_index()
+    if bucket_cleaned and index_cleaned:
         print("Cleanup completed successfully")
     else:
         print("Cleanup completed with errors")
@@ -3,15 +3,16 @@ Utility functions for FHIR bundle manipulation and randomization.
 Used for generating test data and simulating real-world scenarios.
 """
 
-import copy
+import os
 import random
-import uuid
+import re
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List, Match, Optional, Tuple
 from faker import Faker
 
-# Initialize Faker with Swiss locale for realistic data
-fake = Faker(['de_CH', 'fr_CH', 'it_CH'])
+# Swiss locales for realistic data
+SWISS_LOCALES = ('de_CH', 'fr_CH', 'it_CH')
 
 # Mapping of LOINC codes to pathogen descriptions
 # Based on CH-eLM implementation guide
@@ -21,67 +22,289 @@ PATHOGEN_CODE_TO_DESCRIPTION = {
     "70568-1": "Plasmodium sp identified in Blood by Light microscopy"
 }
 
+# Swiss cantons used for patient addresses
+SWISS_CANTONS = (
+    'ZH', 'BE', 'LU', 'UR', 'SZ', 'OW', 'NW', 'GL', 'ZG', 'FR', 'SO', 'BS', 'BL',
+    'SH', 'AR', 'AI', 'SG', 'GR', 'AG', 'TG', 'TI', 'VD', 'VS', 'NE', 'GE', 'JU'
+)
+GENDERS = ('male', 'female')
+ORGANIZATION_TYPES = ('laboratory', 'hospital', 'clinic')
 
-def randomize_patient_data(bundle: Dict[str, Any]) -> Dict[str, Any]:
+
+
+class RandomSource:
     """
-    Replace patient information with random data using Faker.
+    Random number generator and Faker generators used by the randomizers.
 
-    Args:
-        bundle: FHIR Bundle dictionary
+    The module-level `random` functions share one generator across threads.
+    Give each thread or worker its own source instead, and pass a seed for
+    reproducible test data.
+    """
 
-    Returns:
-        Modified bundle with randomized patient data
+    def __init__(self, seed: Optional[int] = None):
+        self.seeded = seed is not None
+        self.rng = random.Random(seed)
+
+        # One Faker generator per Swiss locale, picked once per resource. A
+        # multi-locale Faker re-selects the locale (and a single-locale Faker
+        # proxies the lookup) on every provider call; the bare generators don't.
+        self.fakers = tuple(Faker(locale).factories[0] for locale in SWISS_LOCALES)
+        for fake in self.fakers:
+            fake.seed_instance(self.rng.getrandbits(64))
+
+        # Bound once to skip the attribute lookup on every draw
+        self.choice = self.rng.choice
+        self.randrange = self.rng.randrange
+        self.uniform = self.rng.uniform
+
+    def randbytes(self, n: int) -> bytes:
+        """Random bytes; os.urandom unless the source is seeded and must be reproducible."""
+        return self.rng.randbytes(n) if self.seeded else os.urandom(n)
+
+    def digits(self, digits: int) -> int:
+        """Random integer with exactly `digits` digits (fake.random_number(digits, fix_len=True) without Faker dispatch)."""
+        return self.randrange(10 ** (digits - 1), 10 ** digits)
+
+
+# Used whenever a caller doesn't pass its own source
+_DEFAULT_SOURCE = RandomSource()
+
+
+# Hex digit -> RFC 4122 variant digit (10xx), used when formatting raw UUID bytes
+_UUID_VARIANT = {c: "89ab"[int(c, 16) & 3] for c in "0123456789abcdef"}
+
+
+def _uuid4_batch(count: int, source: RandomSource) -> List[str]:
     """
-    bundle = copy.deepcopy(bundle)
+    Generate `count` random UUID4 strings from a single random-bytes draw.
+
+    Equivalent to [str(uuid.uuid4()) for _ in range(count)] without one
+    urandom syscall and UUID object per identifier.
+    """
+    raw = source.randbytes(16 * count).hex()
+    uuids = []
+    for i in range(0, 32 * count, 32):
+        h = raw[i:i + 32]
+        uuids.append(f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_UUID_VARIANT[h[16]]}{h[17:20]}-{h[20:]}")
+    return uuids
+
+
+def _clone(obj: Any) -> Any:
+    """
+    Deep-copy a JSON tree (dicts, lists and immutable scalars).
+
+    Much cheaper than copy.deepcopy for parsed JSON since it skips the memo
+    and per-type dispatch; scalars are immutable and returned as-is.
+    """
+    t = type(obj)
+    if t is dict:
+        return {k: _clone(v) for k, v in obj.items()}
+    if t is list:
+        return [_clone(v) for v in obj]
+    return obj
+
+
+@dataclass
+class _RandCtx:
+    """Randomization state shared by the per-resource handlers of one bundle."""
+    source: RandomSource
+    report_time: Optional[datetime] = None  # None leaves timestamps untouched
+    timestamp: Optional[str] = field(init=False, default=None)
 
+    def __post_init__(self):
+        if self.report_time is not None:
+            # Second precision: sub-second digits are noise for randomized report times
+            self.timestamp = self.report_time.isoformat(timespec="seconds")
+
+
+ResourceHandler = Callable[[Dict[str, Any], _RandCtx], None]
+
+
+def _apply_handlers(bundle: Dict[str, Any],
+                    handlers: Dict[str, Tuple[ResourceHandler, ...]],
+                    ctx: _RandCtx) -> None:
+    """Walk the entries once, dispatching each resource to the handlers for its resourceType."""
+    for entry in bundle.get("entry", []):
+        resource = entry.get("resource", {})
+        for handler in handlers.get(resource.get("resourceType"), ()):
+            handler(resource, ctx)
+
+
+def _randomize_patient(resource: Dict[str, Any], ctx: _RandCtx) -> None:
+    """Replace a Patient's identifying data with random data using Faker."""
     # Generate random patient data
-    gender = random.choice(['male', 'female'])
+    src = ctx.source
+    fake = src.choice(src.fakers)
+    gender = src.choice(GENDERS)
+    first_name = fake.first_name_male() if gender == 'male' else fake.first_name_female()
+    last_name = fake.last_name()
+
+    # Update identifier (Swiss AHV number format, 13 digits)
+    if "identifier" in resource and resource["identifier"]:
+        resource["identifier"][0]["value"] = f"756{src.digits(10)}"
+
+    # Update name
+    if "name" in resource and resource["name"]:
+        resource["name"][0]["family"] = last_name
+        resource["name"][0]["given"] = [first_name]
+
+    # Update gender and birth date
+    resource["gender"] = gender
+    resource["birthDate"] = fake.date_of_birth(minimum_age=18, maximum_age=90).isoformat()
+
+    # Update address
+    if "address" in resource and resource["address"]:
+        address = resource["address"][0]
+        address["line"] = [f"{fake.street_name()} {fake.building_number()}"]
+        address["city"] = fake.city()
+        address["postalCode"] = fake.postcode()
+        address["state"] = src.choice(SWISS_CANTONS)
+
+
+def _randomize_organization(resource: Dict[str, Any], ctx: _RandCtx) -> None:
+    """Give an Organization a random name and GLN."""
+    # Generate random organization name
+    src = ctx.source
+    fake = src.choice(src.fakers)
+    org_type = src.choice(ORGANIZATION_TYPES)
+
+    if org_type == 'laboratory':
+        org_name = f"{fake.company()} Labor AG"
+    elif org_type == 'hospital':
+        org_name = f"Kantonsspital {fake.city()}"
+    else:
+        org_name = f"Klinik {fake.last_name()}"
+
+    resource["name"] = org_name
+
+    # Update GLN (Global Location Number - Swiss healthcare identifier)
+    if "identifier" in resource and resource["identifier"]:
+        resource["identifier"][0]["value"] = f"760{src.digits(10)}"
+
+
+def _randomize_practitioner(resource: Dict[str, Any], ctx: _RandCtx) -> None:
+    """Give a Practitioner a random name, GLN and contact details."""
+    # Generate random practitioner
+    src = ctx.source
+    fake = src.choice(src.fakers)
+    gender = src.choice(GENDERS)
     first_name = fake.first_name_male() if gender == 'male' else fake.first_name_female()
     last_name = fake.last_name()
-    birth_date = fake.date_of_birth(minimum_age=18, maximum_age=90).isoformat()
 
-    # Swiss AHV number format (13 digits)
-    ahv_number = f"756{fake.random_number(digits=10, fix_len=True)}"
+    if "name" in resource and resource["name"]:
+        resource["name"][0]["family"] = last_name
+        resource["name"][0]["given"] = [first_name]
 
-    # Address
-    street = fake.street_name()
-    street_number = fake.building_number()
-    city = fake.city()
-    postal_code = fake.postcode()
-    canton = random.choice(['ZH', 'BE', 'LU', 'UR', 'SZ', 'OW', 'NW', 'GL', 'ZG', 'FR', 'SO', 'BS', 'BL', 'SH', 'AR', 'AI', 'SG', 'GR', 'AG', 'TG', 'TI', 'VD', 'VS', 'NE', 'GE', 'JU'])
+    # Update GLN
+    if "identifier" in resource and resource["identifier"]:
+        resource["identifier"][0]["value"] = f"760{src.digits(10)}"
 
-    # Replace patient data in bundle
-    for entry in bundle.get("entry", []):
-        resource = entry.get("resource", {})
+    # Update contact info
+    if "telecom" in resource:
+        for contact in resource["telecom"]:
+            if contact.get("system") == "phone":
+                contact["value"] = f"+41 {src.digits(2)} {src.digits(3)} {src.digits(2)} {src.digits(2)}"
+            elif contact.get("system") == "email":
+                contact["value"] = f"{first_name.lower()}.{last_name.lower()}@{fake.domain_name()}"
 
-        if resource.get("resourceType") == "Patient":
-            # Update identifier (AHV number)
-            if "identifier" in resource and resource["identifier"]:
-                resource["identifier"][0]["value"] = ahv_number
 
-            # Update name
-            if "name" in resource and resource["name"]:
-                resource["name"][0]["family"] = last_name
-                resource["name"][0]["given"] = [first_name]
+def _describe_pathogen(resource: Dict[str, Any], ctx: _RandCtx) -> None:
+    """Set the display text of an Observation's LOINC pathogen code."""
+    code_obj = resource.get("code", {})
+    coding = code_obj.get("coding", [])
 
-            # Update gender and birth date
-            resource["gender"] = gender
-            resource["birthDate"] = birth_date
+    for code_entry in coding:
+        if code_entry.get("system") == "http://loinc.org":
+            # One lookup instead of an `in` test followed by indexing
+            description = PATHOGEN_CODE_TO_DESCRIPTION.get(code_entry.get("code"))
+            if description is not None:
+                # Add/update the display field with correct description
+                code_entry["display"] = description
 
-            # Update address
-            if "address" in resource and resource["address"]:
-                address = resource["address"][0]
-                address["line"] = [f"{street} {street_number}"]
-                address["city"] = city
-                address["postalCode"] = postal_code
-                address["state"] = canton
 
+def _stamp_composition(resource: Dict[str, Any], ctx: _RandCtx) -> None:
+    if ctx.report_time is not None and "date" in resource:
+        resource["date"] = ctx.timestamp
+
+
+def _stamp_observation(resource: Dict[str, Any], ctx: _RandCtx) -> None:
+    if ctx.report_time is not None and "effectiveDateTime" in resource:
+        # Observation time slightly before report time
+        observation_time = ctx.report_time - timedelta(hours=ctx.source.uniform(1, 48))
+        resource["effectiveDateTime"] = observation_time.isoformat(timespec="seconds")
+
+
+def _stamp_specimen(resource: Dict[str, Any], ctx: _RandCtx) -> None:
+    if ctx.report_time is not None and "collection" in resource and "collectedDateTime" in resource["collection"]:
+        # Collection time even earlier
+        collection_time = ctx.report_time - timedelta(days=ctx.source.uniform(2, 5))
+        resource["collection"]["collectedDateTime"] = collection_time.date().isoformat()
+
+
+_TIMESTAMP_HANDLERS = {
+    "Composition": (_stamp_composition,),
+    "Observation": (_stamp_observation,),
+    "Specimen": (_stamp_specimen,),
+}
+
+# Everything randomize_bundle does per resource, fused into one dispatch table
+_RESOURCE_HANDLERS = {
+    "Patient": (_randomize_patient,),
+    "Organization": (_randomize_organization,),
+    "Practitioner": (_randomize_practitioner,),
+    "Observation": (_describe_pathogen, _stamp_observation),
+    "Composition": (_stamp_composition,),
+    "Specimen": (_stamp_specimen,),
+}
+
+
+def randomize_patient_data(bundle: Dict[str, Any],
+                           source: Optional[RandomSource] = None,
+                           _in_place: bool = False) -> Dict[str, Any]:
+    """
+    Replace patient information with random data using Faker.
+
+    Args:
+        bundle: FHIR Bundle dictionary
+        source: Random source to draw from (defaults to a shared one)
+
+    Returns:
+        Modified bundle with randomized patient data
+    """
+    if not _in_place:
+        bundle = _clone(bundle)
+
+    _apply_handlers(bundle, {"Patient": (_randomize_patient,)}, _RandCtx(source or _DEFAULT_SOURCE))
     return bundle
 
 
+def draw_report_times(count: int,
+                      days_ago_min: int = 0,
+                      days_ago_max: int = 7,
+                      source: Optional[RandomSource] = None) -> List[datetime]:
+    """
+    Draw `count` random report times in the past against a single clock read.
+
+    Args:
+        count: Number of report times to draw
+        days_ago_min: Minimum days in the past
+        days_ago_max: Maximum days in the past
+        source: Random source to draw from (defaults to a shared one)
+
+    Returns:
+        List of report times, one per bundle
+    """
+    uniform = (source or _DEFAULT_SOURCE).uniform
+    now = datetime.now()
+    return [now - timedelta(days=uniform(days_ago_min, days_ago_max)) for _ in range(count)]
+
+
 def randomize_timestamps(bundle: Dict[str, Any],
                         days_ago_min: int = 0,
-                        days_ago_max: int = 7) -> Dict[str, Any]:
+                        days_ago_max: int = 7,
+                        report_time: Optional[datetime] = None,
+                        source: Optional[RandomSource] = None,
+                        _in_place: bool = False) -> Dict[str, Any]:
     """
     Randomize timestamps in the bundle to simulate reports from the past.
 
@@ -89,59 +312,50 @@ def randomize_timestamps(bundle: Dict[str, Any],
         bundle: FHIR Bundle dictionary
         days_ago_min: Minimum days in the past
         days_ago_max: Maximum days in the past
+        report_time: Pre-drawn report time (see draw_report_times); drawn here if omitted
+        source: Random source to draw from (defaults to a shared one)
 
     Returns:
         Modified bundle with randomized timestamps
     """
-    bundle = copy.deepcopy(bundle)
+    if not _in_place:
+        bundle = _clone(bundle)
 
     # Generate a random timestamp in the past
-    days_ago = random.uniform(days_ago_min, days_ago_max)
-    random_time = datetime.now() - timedelta(days=days_ago)
-    timestamp_str = random_time.isoformat()
+    source = source or _DEFAULT_SOURCE
+    ctx = _RandCtx(source, report_time or draw_report_times(1, days_ago_min, days_ago_max, source)[0])
 
     # Update bundle timestamp
     if "timestamp" in bundle:
-        bundle["timestamp"] = timestamp_str
+        bundle["timestamp"] = ctx.timestamp
 
     # Update resource timestamps
-    for entry in bundle.get("entry", []):
-        resource = entry.get("resource", {})
-        resource_type = resource.get("resourceType")
-
-        if resource_type == "Composition":
-            if "date" in resource:
-                resource["date"] = timestamp_str
-
-        elif resource_type == "Observation":
-            if "effectiveDateTime" in resource:
-                # Observation time slightly before report time
-                observation_time = random_time - timedelta(hours=random.uniform(1, 48))
-                resource["effectiveDateTime"] = observation_time.isoformat()
-
-        elif resource_type == "Specimen":
-            if "collection" in resource and "collectedDateTime" in resource["collection"]:
-                # Collection time even earlier
-                collection_time = random_time - timedelta(days=random.uniform(2, 5))
-                resource["collection"]["collectedDateTime"] = collection_time.date().isoformat()
-
+    _apply_handlers(bundle, _TIMESTAMP_HANDLERS, ctx)
     return bundle
 
 
-def randomize_identifiers(bundle: Dict[str, Any]) -> Dict[str, Any]:
+def randomize_identifiers(bundle: Dict[str, Any],
+                          source: Optional[RandomSource] = None,
+                          _in_place: bool = False) -> Dict[str, Any]:
     """
     Randomize all UUIDs and identifiers in the bundle.
 
     Args:
         bundle: FHIR Bundle dictionary
+        source: Random source to draw from (defaults to a shared one)
 
     Returns:
         Modified bundle with new UUIDs
     """
-    bundle = copy.deepcopy(bundle)
+    if not _in_place:
+        bundle = _clone(bundle)
+
+    # Draw every UUID we may need up front: bundle ID + fullUrl and id per entry
+    entries = bundle.get("entry", [])
+    new_uuids = iter(_uuid4_batch(1 + 2 * len(entries), source or _DEFAULT_SOURCE))
 
     # Generate new bundle ID
-    new_bundle_id = str(uuid.uuid4())
+    new_bundle_id = next(new_uuids)
     if "id" in bundle:
         bundle["id"] = f"Bundle-{new_bundle_id}"
 
@@ -151,19 +365,23 @@ def randomize_identifiers(bundle: Dict[str, Any]) -> Dict[str, Any]:
     # Map old UUIDs to new ones for references
     uuid_map = {}
 
-    # First pass: generate new UUIDs for all resources
-    for entry in bundle.get("entry", []):
+    # (container, key, old value) of every reference, fixed up once all new IDs are known
+    ref_sites = []
+
+    # Single pass: generate new UUIDs for all resources and collect their references
+    for entry in entries:
         old_url = entry.get("fullUrl", "")
         if "urn:uuid:" in old_url:
             old_uuid = old_url.replace("urn:uuid:", "")
-            new_uuid = str(uuid.uuid4())
+            new_uuid = next(new_uuids)
             uuid_map[old_uuid] = new_uuid
             entry["fullUrl"] = f"urn:uuid:{new_uuid}"
 
         resource = entry.get("resource", {})
         if "id" in resource:
             old_id = resource["id"]
-            new_id = str(uuid.uuid4())
+            # Resources often reuse their fullUrl UUID as id - keep both in sync
+            new_id = uuid_map.get(old_id) or next(new_uuids)
             uuid_map[old_id] = new_id
             resource["id"] = new_id
 
@@ -172,162 +390,141 @@ def randomize_identifiers(bundle: Dict[str, Any]) -> Dict[str, Any]:
             if "identifier" in resource and "value" in resource["identifier"]:
                 resource["identifier"]["value"] = f"urn:uuid:{new_bundle_id}"
 
-    # Second pass: update all references
-    for entry in bundle.get("entry", []):
-        resource = entry.get("resource", {})
-        _replace_references_recursive(resource, uuid_map)
+        _collect_references(resource, ref_sites)
 
-    return bundle
+    if not uuid_map:
+        return bundle
 
+    # One alternation over all old IDs (longest first so prefixes never win),
+    # so each reference string is rewritten in a single regex scan
+    pattern = re.compile("|".join(re.escape(old) for old in sorted(uuid_map, key=len, reverse=True)))
 
-def _replace_references_recursive(obj: Any, uuid_map: Dict[str, str]) -> None:
-    """Helper function to recursively replace UUID references."""
-    if isinstance(obj, dict):
-        for key, value in obj.items():
-            if key == "reference" and isinstance(value, str):
-                # Replace UUID references
-                for old_uuid, new_uuid in uuid_map.items():
-                    if old_uuid in value:
-                        obj[key] = value.replace(old_uuid, new_uuid)
-            else:
-                _replace_references_recursive(value, uuid_map)
-    elif isinstance(obj, list):
-        for item in obj:
-            _replace_references_recursive(item, uuid_map)
+    def repl(match: Match[str]) -> str:
+        return uuid_map[match.group(0)]
+
+    # Update all references from the flat list - no second tree walk
+    for obj, key, value in ref_sites:
+        obj[key] = pattern.sub(repl, value)
+
+    return bundle
 
 
-def randomize_organization_data(bundle: Dict[str, Any]) -> Dict[str, Any]:
+def _collect_references(root: Any, sites: List[Tuple[Dict[str, Any], str, str]]) -> None:
+    """Helper function to collect string "reference" fields, walking the tree with an explicit stack."""
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if type(obj) is dict:
+            for key, value in obj.items():
+                value_type = type(value)
+                if value_type is str:
+                    if key == "reference":
+                        sites.append((obj, key, value))
+                elif value_type is dict or value_type is list:
+                    stack.append(value)
+        else:
+            stack.extend(item for item in obj if type(item) is dict or type(item) is list)
+
+
+def randomize_organization_data(bundle: Dict[str, Any],
+                                source: Optional[RandomSource] = None,
+                                _in_place: bool = False) -> Dict[str, Any]:
     """
     Randomize organization (lab, hospital) data.
 
     Args:
         bundle: FHIR Bundle dictionary
+        source: Random source to draw from (defaults to a shared one)
 
     Returns:
         Modified bundle with randomized organization data
     """
-    bundle = copy.deepcopy(bundle)
-
-    for entry in bundle.get("entry", []):
-        resource = entry.get("resource", {})
-
-        if resource.get("resourceType") == "Organization":
-            # Generate random organization name
-            org_type = random.choice(['laboratory', 'hospital', 'clinic'])
-
-            if org_type == 'laboratory':
-                org_name = f"{fake.company()} Labor AG"
-            elif org_type == 'hospital':
-                org_name = f"Kantonsspital {fake.city()}"
-            else:
-                org_name = f"Klinik {fake.last_name()}"
-
-            resource["name"] = org_name
-
-            # Update GLN (Global Location Number - Swiss healthcare identifier)
-            if "identifier" in resource and resource["identifier"]:
-                resource["identifier"][0]["value"] = f"760{fake.random_number(digits=10, fix_len=True)}"
+    if not _in_place:
+        bundle = _clone(bundle)
 
+    _apply_handlers(bundle, {"Organization": (_randomize_organization,)}, _RandCtx(source or _DEFAULT_SOURCE))
     return bundle
 
 
-def randomize_practitioner_data(bundle: Dict[str, Any]) -> Dict[str, Any]:
+def randomize_practitioner_data(bundle: Dict[str, Any],
+                                source: Optional[RandomSource] = None,
+                                _in_place: bool = False) -> Dict[str, Any]:
     """
     Randomize practitioner (doctor) data.
 
     Args:
         bundle: FHIR Bundle dictionary
+        source: Random source to draw from (defaults to a shared one)
 
     Returns:
         Modified bundle with randomized practitioner data
     """
-    bundle = copy.deepcopy(bundle)
-
-    for entry in bundle.get("entry", []):
-        resource = entry.get("resource", {})
-
-        if resource.get("resourceType") == "Practitioner":
-            # Generate random practitioner
-            gender = random.choice(['male', 'female'])
-            first_name = fake.first_name_male() if gender == 'male' else fake.first_name_female()
-            last_name = fake.last_name()
-
-            if "name" in resource and resource["name"]:
-                resource["name"][0]["family"] = last_name
-                resource["name"][0]["given"] = [first_name]
-
-            # Update GLN
-            if "identifier" in resource and resource["identifier"]:
-                resource["identifier"][0]["value"] = f"760{fake.random_number(digits=10, fix_len=True)}"
-
-            # Update contact info
-            if "telecom" in resource:
-                for contact in resource["telecom"]:
-                    if contact.get("system") == "phone":
-                        contact["value"] = f"+41 {fake.random_number(digits=2, fix_len=True)} {fake.random_number(digits=3, fix_len=True)} {fake.random_number(digits=2, fix_len=True)} {fake.random_number(digits=2, fix_len=True)}"
-                    elif contact.get("system") == "email":
-                        contact["value"] = f"{first_name.lower()}.{last_name.lower()}@{fake.domain_name()}"
+    if not _in_place:
+        bundle = _clone(bundle)
 
+    _apply_handlers(bundle, {"Practitioner": (_randomize_practitioner,)}, _RandCtx(source or _DEFAULT_SOURCE))
     return bundle
 
 
-def ensure_pathogen_descriptions(bundle: Dict[str, Any]) -> Dict[str, Any]:
+def ensure_pathogen_descriptions(bundle: Dict[str, Any],
+                                 source: Optional[RandomSource] = None,
+                                 _in_place: bool = False) -> Dict[str, Any]:
     """
     Ensure pathogen codes have correct display/description fields.
 
     Args:
         bundle: FHIR Bundle dictionary
+        source: Random source to draw from (defaults to a shared one)
 
     Returns:
         Modified bundle with correct pathogen descriptions
     """
-    bundle = copy.deepcopy(bundle)
-
-    for entry in bundle.get("entry", []):
-        resource = entry.get("resource", {})
-
-        if resource.get("resourceType") == "Observation":
-            code_obj = resource.get("code", {})
-            coding = code_obj.get("coding", [])
-
-            for code_entry in coding:
-                if code_entry.get("system") == "http://loinc.org":
-                    pathogen_code = code_entry.get("code")
-                    if pathogen_code in PATHOGEN_CODE_TO_DESCRIPTION:
-                        # Add/update the display field with correct description
-                        code_entry["display"] = PATHOGEN_CODE_TO_DESCRIPTION[pathogen_code]
+    if not _in_place:
+        bundle = _clone(bundle)
 
+    _apply_handlers(bundle, {"Observation": (_describe_pathogen,)}, _RandCtx(source or _DEFAULT_SOURCE))
     return bundle
 
 
 def randomize_bundle(bundle: Dict[str, Any],
                     randomize_time: bool = True,
                     days_ago_min: int = 0,
-                    days_ago_max: int = 7) -> Dict[str, Any]:
+                    days_ago_max: int = 7,
+                    report_time: Optional[datetime] = None,
+                    in_place: bool = False,
+                    source: Optional[RandomSource] = None) -> Dict[str, Any]:
     """
     Fully randomize a FHIR bundle for testing.
 
     Applies all randomization functions to create realistic test data.
+    Every randomized field is overwritten on each call, so a caller that owns
+    the bundle can pass in_place=True and re-randomize the same dict repeatedly.
 
     Args:
         bundle: Original FHIR Bundle dictionary
         randomize_time: Whether to randomize timestamps
         days_ago_min: Minimum days in the past for timestamps
         days_ago_max: Maximum days in the past for timestamps
+        report_time: Pre-drawn report time (see draw_report_times)
+        in_place: Mutate the given bundle instead of a copy
+        source: Random source to draw from (defaults to a shared one; use one per thread)
 
     Returns:
         Fully randomized bundle
     """
-    bundle = copy.deepcopy(bundle)
+    # Clone once (unless the caller owns the bundle), then let every step mutate it in place
+    if not in_place:
+        bundle = _clone(bundle)
 
-    # Apply all randomization functions
-    bundle = randomize_identifiers(bundle)
-    bundle = randomize_patient_data(bundle)
-    bundle = randomize_organization_data(bundle)
-    bundle = randomize_practitioner_data(bundle)
-    bundle = ensure_pathogen_descriptions(bundle)
+    source = source or _DEFAULT_SOURCE
+    randomize_identifiers(bundle, source, _in_place=True)
 
+    ctx = _RandCtx(source)
     if randomize_time:
-        bundle = randomize_timestamps(bundle, days_ago_min, days_ago_max)
+        ctx = _RandCtx(source, report_time or draw_report_times(1, days_ago_min, days_ago_max, source)[0])
+        if "timestamp" in bundle:
+            bundle["timestamp"] = ctx.timestamp
 
+    # Patient, organization, practitioner, pathogen and timestamp updates in a single pass
+    _apply_handlers(bundle, _RESOURCE_HANDLERS, ctx)
     return bundle
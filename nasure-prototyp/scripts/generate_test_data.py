@@ -16,20 +16,28 @@ Usage:
 
     # Send bundles from last 30 days
     python scripts/generate_test_data.py --count 100 --days-min 0 --days-max 30
+
+    # Keep 8 requests in flight at once
+    python scripts/generate_test_data.py --count 1000 --delay 0 --concurrency 8
 """
 
 import argparse
-import json
+import os
 import sys
 import time
-import random
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Union
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
-from fhir_utils import randomize_bundle
+from fhir_utils import RandomSource, draw_report_times, randomize_bundle
+
+# Connections kept alive by the shared session
+DEFAULT_POOL_SIZE = 64
 
 
 def load_example_bundles(examples_dir: Path = None) -> List[dict]:
@@ -45,11 +53,15 @@ def load_example_bundles(examples_dir: Path = None) -> List[dict]:
     if examples_dir is None:
         examples_dir = Path(__file__).parent.parent / "examples" / "ch_elm_bundles"
 
+    # scandir yields the entry type without an extra stat() per file
+    with os.scandir(examples_dir) as it:
+        json_files = [e for e in it if e.name.endswith(".json") and e.is_file()]
+
     bundles = []
-    for json_file in examples_dir.glob("*.json"):
+    for json_file in json_files:
         try:
-            with open(json_file, 'r') as f:
-                bundle = json.load(f)
+            with open(json_file.path, 'rb') as f:
+                bundle = orjson.loads(f.read())
                 bundles.append(bundle)
                 print(f"✓ Loaded {json_file.name}")
         except Exception as e:
@@ -58,23 +70,50 @@ def load_example_bundles(examples_dir: Path = None) -> List[dict]:
     return bundles
 
 
-def send_bundle_to_api(bundle: dict, api_url: str = "http://localhost:8000") -> dict:
+def create_session(pool_size: int = 1) -> requests.Session:
+    """
+    Create an HTTP session that keeps up to `pool_size` connections alive.
+
+    Args:
+        pool_size: Maximum number of pooled connections per host
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared keep-alive session so repeated sends skip the TCP handshake
+SESSION = create_session(DEFAULT_POOL_SIZE)
+
+
+def send_bundle_to_api(
+    bundle: Union[dict, bytes],
+    api_url: str = "http://localhost:8000",
+    session: Optional[requests.Session] = None
+) -> dict:
     """
     Send a FHIR bundle to the ingestion API.
 
     Args:
-        bundle: FHIR Bundle dictionary
+        bundle: FHIR Bundle dictionary, or its already encoded JSON bytes
         api_url: Base URL of the API
+        session: Session to send with (defaults to the shared SESSION)
 
     Returns:
         API response as dictionary
     """
     endpoint = f"{api_url}/api/v1/fhir/ingest"
+    session = session or SESSION
 
     try:
-        response = requests.post(
+        response = session.post(
             endpoint,
-            json=bundle,
+            data=bundle if isinstance(bundle, bytes) else orjson.dumps(bundle),
             headers={"Content-Type": "application/json"},
             timeout=10
         )
@@ -92,11 +131,16 @@ def generate_and_send_bundles(
     days_min: int = 0,
     days_max: int = 7,
     api_url: str = "http://localhost:8000",
-    examples_dir: Path = None
+    examples_dir: Path = None,
+    concurrency: int = 1,
+    seed: Optional[int] = None
 ):
     """
     Generate randomized bundles and send them to the API.
 
+    Randomization runs on the calling thread while up to `concurrency`
+    requests are in flight on a thread pool sharing one pooled session.
+
     Args:
         count: Number of bundles to send (ignored if continuous=True)
         delay: Delay between sends in seconds
@@ -105,6 +149,8 @@ def generate_and_send_bundles(
         days_max: Maximum days in the past for timestamps
         api_url: Base URL of the API
         examples_dir: Path to examples directory
+        concurrency: Maximum number of requests in flight
+        seed: Seed for reproducible bundle content (default: random)
     """
     # Load example bundles
     print("\n" + "=" * 60)
@@ -122,43 +168,67 @@ def generate_and_send_bundles(
     print("\n" + "=" * 60)
     print(f"{'Continuous' if continuous else f'Sending {count}'} bundle generation")
     print(f"Delay: {delay}s | Time range: {days_min}-{days_max} days ago")
+    print(f"Concurrency: {concurrency}")
     print(f"API: {api_url}")
     print("=" * 60 + "\n")
 
     sent_count = 0
     failed_count = 0
+    session = SESSION if concurrency <= DEFAULT_POOL_SIZE else create_session(concurrency)
+    # Own random source, so a seed reproduces the same bundles
+    source = RandomSource(seed)
 
     try:
-        while True:
-            # Select random example bundle
-            original_bundle = random.choice(example_bundles)
-
-            # Randomize the bundle
-            randomized_bundle = randomize_bundle(
-                original_bundle,
-                randomize_time=True,
-                days_ago_min=days_min,
-                days_ago_max=days_max
-            )
-
-            # Send to API
-            try:
-                response = send_bundle_to_api(randomized_bundle, api_url)
-                bundle_id = response.get("bundle_id", "unknown")
-                sent_count += 1
-
-                print(f"[{sent_count:4d}] ✓ Sent bundle {bundle_id}")
-
-            except Exception as e:
-                failed_count += 1
-                print(f"[{sent_count + failed_count:4d}] ✗ Failed to send bundle: {e}")
-
-            # Check if we should stop
-            if not continuous and sent_count >= count:
-                break
-
-            # Wait before next send
-            time.sleep(delay)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            in_flight = set()
+            while True:
+                # Top up the in-flight requests without overshooting count
+                free_slots = concurrency - len(in_flight)
+                if not continuous:
+                    free_slots = min(free_slots, count - sent_count - len(in_flight))
+
+                # Draw the report times for this batch in one go
+                for report_time in draw_report_times(free_slots, days_min, days_max, source):
+                    # Select random example bundle
+                    bundle = source.choice(example_bundles)
+
+                    # Re-randomize the loaded bundle in place - we own it, and every
+                    # randomized field is overwritten on each pass, so no copy is needed
+                    randomize_bundle(
+                        bundle,
+                        randomize_time=True,
+                        days_ago_min=days_min,
+                        days_ago_max=days_max,
+                        report_time=report_time,
+                        in_place=True,
+                        source=source
+                    )
+
+                    # Encode now so the next pass can't mutate it while in flight
+                    payload = orjson.dumps(bundle)
+
+                    # Send to API
+                    in_flight.add(executor.submit(send_bundle_to_api, payload, api_url, session))
+
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        response = future.result()
+                        bundle_id = response.get("bundle_id", "unknown")
+                        sent_count += 1
+
+                        print(f"[{sent_count:4d}] ✓ Sent bundle {bundle_id}")
+
+                    except Exception as e:
+                        failed_count += 1
+                        print(f"[{sent_count + failed_count:4d}] ✗ Failed to send bundle: {e}")
+
+                # Check if we should stop
+                if not continuous and sent_count >= count:
+                    break
+
+                # Wait before next send
+                time.sleep(delay)
 
     except KeyboardInterrupt:
         print("\n\n" + "=" * 60)
@@ -191,6 +261,9 @@ Examples:
 
   # Use custom API URL
   %(prog)s --count 50 --api-url http://api.example.com:8000
+
+  # Keep 8 requests in flight at once
+  %(prog)s --count 1000 --delay 0 --concurrency 8
         """
     )
 
@@ -235,6 +308,20 @@ Examples:
         help="Base URL of the API (default: http://localhost:8000)"
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Maximum number of requests in flight (default: 1)"
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for reproducible bundle content (default: random)"
+    )
+
     parser.add_argument(
         "--examples-dir",
         type=Path,
@@ -257,6 +344,9 @@ Examples:
     if not args.continuous and args.count <= 0:
         parser.error("count must be > 0 (or use --continuous)")
 
+    if args.concurrency < 1:
+        parser.error("concurrency must be >= 1")
+
     # Run the generator
     generate_and_send_bundles(
         count=args.count,
@@ -265,7 +355,9 @@ Examples:
         days_min=args.days_min,
         days_max=args.days_max,
         api_url=args.api_url,
-        examples_dir=args.examples_dir
+        examples_dir=args.examples_dir,
+        concurrency=args.concurrency,
+        seed=args.seed
     )
 
 
@@ -8,34 +8,46 @@ Usage:
 
     # Send bundles one by one with intervals
     python scripts/send_test_bundles.py --interval 30
+
+    # Limit the number of bundles in flight
+    python scripts/send_test_bundles.py --concurrency 8
+
+    # Multiplex all uploads over HTTP/2 (needs `pip install httpx[http2]`
+    # and an HTTPS endpoint that negotiates h2, e.g. a reverse proxy)
+    API_URL=https://fhir.example.org python scripts/send_test_bundles.py --http2
 """
 
 import argparse
-import json
-import time
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import requests
+import httpx
+
+DEFAULT_CONCURRENCY = 32
 
 
 def get_api_url():
-    """Get API URL from environment variables."""
+    """Get API URL from environment variables (API_URL overrides API_HOST)."""
+    if os.environ.get("API_URL"):
+        return os.environ["API_URL"].rstrip("/")
     host = os.environ.get("API_HOST", "localhost")
     port = 8000
     return f"http://{host}:{port}"
 
 
-def send_bundle(bundle_data: dict, source_system: str, api_url: str) -> bool:
-    """Send a FHIR bundle to the API."""
-    payload = {
-        "bundle": bundle_data,
-        "source_system": source_system
-    }
+async def send_bundle(client: httpx.AsyncClient, bundle_bytes: bytes, source_system: str, api_url: str) -> bool:
+    """Send a FHIR bundle to the API.
 
+    The ingest endpoint takes the bundle itself as the request body, so the
+    file contents are posted as-is without decoding and re-encoding them.
+    """
     try:
-        response = requests.post(
+        response = await client.post(
             f"{api_url}/api/v1/fhir/ingest",
-            json=payload,
+            content=bundle_bytes,
+            params={"source_system": source_system},
+            headers={"Content-Type": "application/json"},
             timeout=30
         )
 
@@ -47,26 +59,99 @@ def send_bundle(bundle_data: dict, source_system: str, api_url: str) -> bool:
             print(f"Failed: {response.status_code} - {response.text[:200]}")
             return False
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"Request failed: {e}")
         return False
 
 
-def health_check(api_url: str) -> bool:
+async def send_one(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    bundle_file: Path,
+    source_system: str,
+    api_url: str,
+) -> bool:
+    """Load one bundle file and send it, holding a semaphore slot while in flight."""
+    async with sem:
+        print(f"Sending: {bundle_file.name}")
+        try:
+            bundle_bytes = await asyncio.to_thread(bundle_file.read_bytes)
+        except OSError as e:
+            print(f"Error loading {bundle_file.name}: {e}")
+            return False
+        return await send_bundle(client, bundle_bytes, source_system, api_url)
+
+
+async def health_check(client: httpx.AsyncClient, api_url: str) -> bool:
     """Check if the FHIR API is available."""
     try:
-        response = requests.get(f"{api_url}/health", timeout=5)
+        response = await client.get(f"{api_url}/health", timeout=5)
         if response.status_code == 200:
             print(f"FHIR API healthy at {api_url}")
             return True
         else:
             print(f"FHIR API unhealthy: {response.status_code}")
             return False
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"Cannot reach FHIR API at {api_url}: {e}")
         return False
 
 
+async def send_all(bundle_files: list, args, api_url: str) -> None:
+    """Send all bundles concurrently, bounded by --concurrency."""
+    # File reads go through asyncio.to_thread; give the default executor one
+    # thread per in-flight bundle so reads overlap with the uploads of the
+    # other tasks instead of queueing behind a smaller CPU-sized pool.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=args.concurrency)
+    )
+
+    # One pooled client for all requests; connection-level retries cover
+    # transient connect failures while the API is starting up.
+    # With HTTP/2 a handful of connections carry all streams; with HTTP/1.1
+    # every in-flight request needs its own connection.
+    connections = min(4, args.concurrency) if args.http2 else args.concurrency
+    limits = httpx.Limits(
+        max_connections=connections,
+        max_keepalive_connections=connections,
+    )
+    if args.http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            print("HTTP/2 support requires the h2 package: pip install httpx[http2]")
+            return
+    transport = httpx.AsyncHTTPTransport(retries=3, limits=limits, http2=args.http2)
+    async with httpx.AsyncClient(transport=transport) as client:
+        if not await health_check(client, api_url):
+            print("\nAPI not available. Make sure services are running:")
+            print("   docker-compose up -d")
+            return
+
+        print(f"Found {len(bundle_files)} bundle(s)\n")
+
+        sem = asyncio.Semaphore(args.concurrency)
+        async with asyncio.TaskGroup() as tg:
+            tasks = []
+            for i, bundle_file in enumerate(bundle_files):
+                tasks.append(tg.create_task(
+                    send_one(client, sem, bundle_file, args.source_system, api_url)
+                ))
+                if args.interval > 0 and i < len(bundle_files) - 1:
+                    await asyncio.sleep(args.interval)
+
+    success_count = sum(task.result() for task in tasks)
+    print(f"\nSent {success_count}/{len(bundle_files)} bundles successfully")
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Send FHIR bundles from examples/ch_elm_bundles to the API"
@@ -86,6 +171,19 @@ def main():
         help="Source system identifier (default: test-system)"
     )
 
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Multiplex requests over HTTP/2 (HTTPS endpoints only, needs httpx[http2])"
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=positive_int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum number of bundles in flight (default: {DEFAULT_CONCURRENCY})"
+    )
+
     args = parser.parse_args()
 
     script_dir = Path(__file__).parent
@@ -97,38 +195,20 @@ def main():
     print(f"Examples directory: {examples_dir}")
     print(f"API URL: {api_url}\n")
 
-    if not health_check(api_url):
-        print("\nAPI not available. Make sure services are running:")
-        print("   docker-compose up -d")
-        return
-
     bundle_files = sorted(examples_dir.glob("*.json"))
 
     if not bundle_files:
         print(f"No JSON files found in {examples_dir}")
         return
 
-    print(f"Found {len(bundle_files)} bundle(s)\n")
-
-    success_count = 0
-    for i, bundle_file in enumerate(bundle_files):
-        print(f"Sending: {bundle_file.name}")
-
-        try:
-            with open(bundle_file, 'r', encoding='utf-8') as f:
-                bundle_data = json.load(f)
-
-            if send_bundle(bundle_data, args.source_system, api_url):
-                success_count += 1
-
-            if args.interval > 0 and i < len(bundle_files) - 1:
-                time.sleep(args.interval)
-
-        except Exception as e:
-            print(f"Error loading {bundle_file.name}: {e}")
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
 
-    print(f"\nSent {success_count}/{len(bundle_files)} bundles successfully")
+    asyncio.run(send_all(bundle_files, args, api_url))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -9,9 +9,11 @@ Usage:
     python scripts/setup_test_data.py
 """
 
-import json
+import orjson
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # CH-ELM bundle URLs from the official IG
@@ -22,18 +24,30 @@ BUNDLE_URLS = {
 }
 
 
-def download_bundle(url: str, name: str, output_dir: Path) -> bool:
+def create_session() -> requests.Session:
+    """Create a session that reuses one connection to build.fhir.org and retries transient errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=len(BUNDLE_URLS),
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def download_bundle(session: requests.Session, url: str, name: str, output_dir: Path) -> bool:
     """Download a FHIR bundle from the IG."""
     try:
         print(f"Downloading {name}...", end=" ")
-        response = requests.get(url, timeout=30)
+        response = session.get(url, timeout=30)
         response.raise_for_status()
 
-        bundle_data = response.json()
+        bundle_data = orjson.loads(response.content)
 
         output_file = output_dir / f"{name}.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(bundle_data, f, indent=2, ensure_ascii=False)
+        output_file.write_bytes(orjson.dumps(bundle_data, option=orjson.OPT_INDENT_2))
 
         print(f"Saved to {output_file.name}")
         return True
@@ -41,7 +55,7 @@ def download_bundle(url: str, name: str, output_dir: Path) -> bool:
     except requests.exceptions.RequestException as e:
         print(f"Failed: {e}")
         return False
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"Invalid JSON: {e}")
         return False
 
@@ -56,9 +70,10 @@ def main():
     print(f"Downloading CH-ELM bundles to: {examples_dir}\n")
 
     success_count = 0
-    for name, url in BUNDLE_URLS.items():
-        if download_bundle(url, name, examples_dir):
-            success_count += 1
+    with create_session() as session:
+        for name, url in BUNDLE_URLS.items():
+            if download_bundle(session, url, name, examples_dir):
+                success_count += 1
 
     print(f"\nDownloaded {success_count}/{len(BUNDLE_URLS)} bundles successfully")
 
@@ -7,6 +7,7 @@ from sqlalchemy import (
     String,
     Date,
     ForeignKey,
+    Index,
     event,
 )
 from sqlalchemy.orm import registry
@@ -38,6 +39,11 @@ case_to_products = Table(
     Column("product_id", String(255), nullable=False),
 )
 
+# Matches the filter order of the repository's patient/pathogen lookups; the
+# trailing case_date serves the date-window range of _get_cases_within_window
+Index("ix_cases_patient_pathogen_date", cases.c.patient_id, cases.c.pathogen, cases.c.case_date)
+Index("ix_c2p_case_id", case_to_products.c.case_id)
+
 def start_mappers():
     logger.info("Starting mappers")
     
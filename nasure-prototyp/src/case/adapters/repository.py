@@ -1,6 +1,8 @@
 import abc
+from datetime import datetime, timedelta
+from sqlalchemy import select
 from case.domain import domain
-from typing import List
+from typing import Dict, Iterator, List
 import logging
 
 logger = logging.getLogger(__name__)
@@ -8,29 +10,68 @@ logger = logging.getLogger(__name__)
 
 class AbstractRepository(abc.ABC):
     def __init__(self):
-        self.seen = set() 
+        # Keyed by object identity: CaseRecord is an eq-dataclass and therefore unhashable
+        self.seen: Dict[int, domain.CaseRecord] = {}
 
     def add(self, case: domain.CaseRecord) -> str:
         self._add(case)
-        self.seen.add(case)
+        self.seen[id(case)] = case
         return case.case_id
 
+    def add_many(self, cases: List[domain.CaseRecord]) -> List[str]:
+        """Add several cases in one go and track them in seen; returns their case_ids."""
+        if not cases:
+            return []
+        self._add_many(cases)
+        for case in cases:
+            self.seen[id(case)] = case
+        return [case.case_id for case in cases]
+
     def get(self, case_id) -> domain.CaseRecord:
         case = self._get(case_id)
         if case:
-            self.seen.add(case)
+            self.seen[id(case)] = case
         return case
 
     def get_cases_by_patient_and_pathogen(self, patient_id: str, pathogen_code: str) -> List[domain.CaseRecord]:
         cases = self._get_cases_by_patient_and_pathogen(patient_id, pathogen_code)
         for case in cases:
-            self.seen.add(case)
+            self.seen[id(case)] = case
+        return cases
+
+    def get_cases_within_window(
+        self, patient_id: str, pathogen_code: str, incoming_date: datetime, window_days: int
+    ) -> List[domain.CaseRecord]:
+        """Cases for patient/pathogen whose case_date may lie within ± window_days of incoming_date.
+
+        The result is a superset narrowed by calendar date; callers still
+        compute the exact day difference.
+        """
+        cases = self._get_cases_within_window(patient_id, pathogen_code, incoming_date, window_days)
+        for case in cases:
+            self.seen[id(case)] = case
         return cases
 
+    def _get_cases_within_window(
+        self, patient_id: str, pathogen_code: str, incoming_date: datetime, window_days: int
+    ) -> List[domain.CaseRecord]:
+        return self._get_cases_by_patient_and_pathogen(patient_id, pathogen_code)
+
+    def iter_cases_by_patient_and_pathogen(self, patient_id: str, pathogen_code: str) -> Iterator[domain.CaseRecord]:
+        """Stream cases for read-only use; they are not tracked in seen."""
+        return self._iter_cases_by_patient_and_pathogen(patient_id, pathogen_code)
+
+    def _iter_cases_by_patient_and_pathogen(self, patient_id: str, pathogen_code: str) -> Iterator[domain.CaseRecord]:
+        return iter(self._get_cases_by_patient_and_pathogen(patient_id, pathogen_code))
+
     @abc.abstractmethod
     def _add(self, case: domain.CaseRecord):
         raise NotImplementedError
 
+    def _add_many(self, cases: List[domain.CaseRecord]):
+        for case in cases:
+            self._add(case)
+
     @abc.abstractmethod
     def _get(self, case_id) -> domain.CaseRecord:
         raise NotImplementedError
@@ -47,6 +88,15 @@ class SqlAlchemyRepository(AbstractRepository):
     def _add(self, case):
         self.session.add(case)
 
+    def _add_many(self, cases):
+        """Add all cases and flush them at once.
+
+        The flush batches the INSERTs via insertmanyvalues (with RETURNING),
+        so the cases stay attached to the session and get their case_id.
+        """
+        self.session.add_all(cases)
+        self.session.flush()
+
     def _get(self, case_id):
         return self.session.query(domain.CaseRecord).filter_by(case_id=case_id).first()
     
@@ -56,3 +106,28 @@ class SqlAlchemyRepository(AbstractRepository):
             .filter(domain.CaseRecord.patient_id == patient_id)\
             .filter(domain.CaseRecord.pathogen == pathogen_code)\
             .all()
+
+    def _iter_cases_by_patient_and_pathogen(self, patient_id: str, pathogen_code: str) -> Iterator[domain.CaseRecord]:
+        """Stream matching cases in batches of 1000 rows through a server-side cursor."""
+        return iter(self.session.scalars(
+            select(domain.CaseRecord)
+            .where(domain.CaseRecord.patient_id == patient_id)
+            .where(domain.CaseRecord.pathogen == pathogen_code)
+            .execution_options(yield_per=1000)
+        ))
+
+    def _get_cases_within_window(self, patient_id, pathogen_code, incoming_date, window_days):
+        """Let the database drop cases outside the window before they are loaded.
+
+        case_date holds ISO 8601 strings, which sort lexically by date, so a
+        string range on the (patient_id, pathogen, case_date) index narrows the
+        candidates. One extra day on each side absorbs UTC offsets.
+        """
+        lower = (incoming_date - timedelta(days=window_days + 1)).date().isoformat()
+        upper = (incoming_date + timedelta(days=window_days + 2)).date().isoformat()
+        return self.session.query(domain.CaseRecord)\
+            .filter(domain.CaseRecord.patient_id == patient_id)\
+            .filter(domain.CaseRecord.pathogen == pathogen_code)\
+            .filter(domain.CaseRecord.case_date >= lower)\
+            .filter(domain.CaseRecord.case_date < upper)\
+            .all()
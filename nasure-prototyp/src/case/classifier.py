@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import timedelta
+from typing import Dict, List, Optional, Set, Tuple
 import pandas as pd
 import numpy as np
 import uuid
@@ -7,7 +8,7 @@ import uuid
 # ------------------------------
 # 1) Datenstruktur für einen eingehenden Datensatz
 # ------------------------------
-@dataclass
+@dataclass(slots=True)
 class IncomingElement:
     Patient_ID: str
     Pathogen_code: str
@@ -23,14 +24,75 @@ def ensure_datetime(df: pd.DataFrame, col: str) -> None:
     Konvertiert eine Spalte sicher in datetime (in-place).
     Falls sie schon datetime ist, passiert nichts.
     """
-    if col in df.columns:
+    if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
         df[col] = pd.to_datetime(df[col], errors="coerce")
  
+def build_id_index(df: pd.DataFrame) -> Dict[str, List[int]]:
+    """
+    Baut einen Index Meldungs-ID -> Zeilenpositionen über die Spalte 'ID'
+    (z. B. für labordatenprodukt / klinikdatenprodukt).
+    Einmal aufbauen und an collect_case_evidence übergeben, statt pro Aufruf
+    die ganze Spalte mit .isin zu scannen.
+    """
+    index: Dict[str, List[int]] = {}
+    for pos, meldung_id in enumerate(df["ID"]):
+        index.setdefault(meldung_id, []).append(pos)
+    return index
+
+def build_pair_set(fall_meldung_tabelle: pd.DataFrame) -> Set[Tuple[str, str]]:
+    """
+    Menge aller (ID, case_ID)-Paare aus 'Fall_meldung_tabelle'.
+    Einmal aufbauen und an upsert_case_and_link_id übergeben; die Funktion
+    hält die Menge dann selbst aktuell.
+    """
+    return set(zip(fall_meldung_tabelle["ID"], fall_meldung_tabelle["case_ID"]))
+
+def rows_for_ids(df: pd.DataFrame, ids, by_id: Optional[Dict[str, List[int]]] = None) -> pd.DataFrame:
+    """
+    Zeilen aus df, deren 'ID' in ids liegt. Mit by_id (siehe build_id_index)
+    per Hash-Lookup, sonst per .isin über die ganze Spalte.
+    """
+    if by_id is None:
+        return df[df["ID"].isin(ids)]
+    positions = sorted(pos for meldung_id in ids for pos in by_id.get(meldung_id, ()))
+    return df.iloc[positions]
+
+# Nanosekunden pro Tag, für ganze 24h-Perioden wie bei Timedelta.days
+_NS_PER_DAY = 24 * 60 * 60 * 10**9
+
+def to_datetime64(value) -> np.datetime64:
+    """
+    Einzelnes Datum als datetime64[ns]; fehlende oder nicht lesbare Werte
+    werden zu NaT (wie pd.to_datetime(..., errors="coerce")).
+    """
+    timestamp = pd.to_datetime(value, errors="coerce")
+    if pd.isna(timestamp):
+        return np.datetime64("NaT", "ns")
+    return np.datetime64(timestamp.to_datetime64(), "ns")
+
+def nearest_within_window(dates: np.ndarray, target: np.datetime64, case_duration_days: int) -> int:
+    """
+    Position des Datums in dates (datetime64[ns]) mit der kleinsten Abweichung
+    zu target, sofern innerhalb von ± case_duration_days; sonst -1.
+
+    Die Abweichung zählt ganze 24h-Perioden der absoluten Differenz, wie
+    (a - b).abs().dt.days: 28 Tage und 23 Stunden liegen noch im 28-Tage-Fenster.
+    NaT-Daten sind nie ein Treffer, ein NaT-target trifft nichts.
+    """
+    if np.isnat(target):
+        return -1
+    abs_day_diff = np.abs((dates - target).view("i8")) // _NS_PER_DAY
+    within_window = np.flatnonzero((abs_day_diff <= case_duration_days) & ~np.isnat(dates))
+    if not within_window.size:
+        return -1
+    return int(within_window[abs_day_diff[within_window].argmin()])
+
 def new_case_id() -> str:
     """
-    Erzeugt eine neue, zufällige case_ID.
+    Erzeugt eine neue, zufällige case_ID (UUID4 als 32 Hex-Zeichen ohne Bindestriche;
+    uuid.UUID(case_id) liefert bei Bedarf die Standardform).
     """
-    return str(uuid.uuid4())
+    return uuid.uuid4().hex
  
 # ------------------------------
 # 3) Kernfunktion: Upsert Case + Link Meldungs-ID
@@ -40,7 +102,8 @@ def upsert_case_and_link_id(
     incoming: IncomingElement,
     falldatenprodukt: pd.DataFrame,
     fall_meldung_tabelle: pd.DataFrame,
-    case_duration_days: int = 28
+    case_duration_days: int = 28,
+    pair_set: Optional[Set[Tuple[str, str]]] = None
 ):
     """
     Schritte:
@@ -54,33 +117,31 @@ def upsert_case_and_link_id(
     - In beiden Fällen tragen wir (ID, case_ID) in 'Fall_meldung_tabelle' ein
       (aber nur, falls dieses Paar noch nicht existiert).
     - Die Funktion gibt die verwendete case_ID zurück.
+
+    pair_set: optionale Menge der bestehenden (ID, case_ID)-Paare (siehe
+    build_pair_set); ersetzt den Spaltenscan der Paar-Prüfung durch einen
+    O(1)-Lookup und wird hier mitgeführt.
     """
  
     # Sicherstellen, dass Datums-Spalten datetime sind
     ensure_datetime(falldatenprodukt, "Date")
  
-    # Filter: gleiches Patient_ID + Pathogen_code
-    same_patient_pathogen = falldatenprodukt[
-        (falldatenprodukt["Patient_ID"] == incoming.Patient_ID) &
-        (falldatenprodukt["Pathogen_code"] == incoming.Pathogen_code)
-    ].copy()
- 
+    # Filter: gleiches Patient_ID + Pathogen_code, als eine Maske direkt auf
+    # den NumPy-Spalten (keine Zwischen-DataFrames, keine .copy())
+    mask = np.equal(falldatenprodukt["Patient_ID"].to_numpy(), incoming.Patient_ID)
+    np.logical_and(
+        mask, falldatenprodukt["Pathogen_code"].to_numpy() == incoming.Pathogen_code, out=mask
+    )
+    candidates = np.flatnonzero(mask)
+
     # Wenn es passende Zeilen gibt, prüfen wir die Datumsnähe (± 28 Tage)
-    if not same_patient_pathogen.empty:
-        # absolute Differenz in Tagen
-        same_patient_pathogen["abs_day_diff"] = (
-            (same_patient_pathogen["Date"] - incoming.Date).abs().dt.days
-        )
- 
-        # Fälle innerhalb des Fensters
-        within_window = same_patient_pathogen[
-            same_patient_pathogen["abs_day_diff"] <= case_duration_days
-        ]
- 
-        if not within_window.empty:
+    if candidates.size:
+        dates = falldatenprodukt["Date"].to_numpy(dtype="datetime64[ns]")[candidates]
+        best = nearest_within_window(dates, to_datetime64(incoming.Date), case_duration_days)
+
+        if best >= 0:
             # Nimm den Fall mit der kleinsten Abweichung
-            idx = within_window["abs_day_diff"].idxmin()
-            case_id = within_window.loc[idx, "case_ID"]
+            case_id = falldatenprodukt["case_ID"].iat[candidates[best]]
         else:
             # Kein Fall im Zeitfenster -> Neuer Fall
             case_id = new_case_id()
@@ -108,10 +169,14 @@ def upsert_case_and_link_id(
  
     # Jetzt die (ID, case_ID)-Verknüpfung in Fall_meldung_tabelle ergänzen,
     # aber nur, wenn das Paar noch nicht existiert.
-    pair_exists = (
-        (fall_meldung_tabelle["ID"] == incoming.ID) &
-        (fall_meldung_tabelle["case_ID"] == case_id)
-    ).any()
+    if pair_set is not None:
+        pair_exists = (incoming.ID, case_id) in pair_set
+        pair_set.add((incoming.ID, case_id))
+    else:
+        pair_exists = (
+            (fall_meldung_tabelle["ID"] == incoming.ID) &
+            (fall_meldung_tabelle["case_ID"] == case_id)
+        ).any()
     if not pair_exists:
         fall_meldung_tabelle.loc[len(fall_meldung_tabelle)] = {
             "ID": incoming.ID,
@@ -120,6 +185,181 @@ def upsert_case_and_link_id(
  
     return case_id
  
+def upsert_cases_bulk(
+    incomings: List[IncomingElement],
+    falldatenprodukt: pd.DataFrame,
+    fall_meldung_tabelle: pd.DataFrame,
+    case_duration_days: int = 28
+) -> Tuple[List[str], pd.DataFrame, pd.DataFrame]:
+    """
+    Batch-Variante von upsert_case_and_link_id.
+
+    - Die bestehenden Fälle werden einmal per groupby nach
+      (Patient_ID, Pathogen_code) indiziert, statt pro Element zu filtern.
+    - Jedes Element sucht mit nearest_within_window (wie der sequenzielle und
+      der Streaming-Pfad) den nächstliegenden Fall im Zeitfenster, unter den
+      bestehenden und den im selben Batch bereits eröffneten Fällen. Das
+      Ergebnis entspricht damit einem sequenziellen Aufruf in Eingabereihenfolge.
+    - Elemente ohne Treffer eröffnen neue Fälle.
+    - Neue Fälle und neue (ID, case_ID)-Paare werden mit je einem pd.concat
+      angehängt.
+
+    Da pd.concat neue DataFrames erzeugt, gibt die Funktion
+    (case_IDs in Eingabereihenfolge, falldatenprodukt, fall_meldung_tabelle) zurück.
+    """
+    if not incomings:
+        return [], falldatenprodukt, fall_meldung_tabelle
+
+    ensure_datetime(falldatenprodukt, "Date")
+
+    # Ein groupby statt eines Filters pro Element; Positionen in Zeilenreihenfolge
+    rows_by_pp = falldatenprodukt.groupby(["Patient_ID", "Pathogen_code"], sort=False).indices
+    fall_dates = falldatenprodukt["Date"].to_numpy(dtype="datetime64[ns]")
+    fall_case_ids = falldatenprodukt["case_ID"].to_numpy()
+
+    # (Patient_ID, Pathogen_code) -> ([Datum, ...], [case_ID, ...]), bestehende
+    # Fälle zuerst, dann die im Batch eröffneten (wie die Zeilen beim sequenziellen Anhängen)
+    candidates: Dict[Tuple[str, str], Tuple[List[np.datetime64], List[str]]] = {}
+    case_ids = []
+    new_rows = []
+    for incoming in incomings:
+        key = (incoming.Patient_ID, incoming.Pathogen_code)
+        dates_and_ids = candidates.get(key)
+        if dates_and_ids is None:
+            positions = rows_by_pp.get(key)
+            if positions is None:
+                dates_and_ids = candidates[key] = ([], [])
+            else:
+                dates_and_ids = candidates[key] = (
+                    list(fall_dates[positions]), list(fall_case_ids[positions])
+                )
+        dates, ids = dates_and_ids
+
+        date = to_datetime64(incoming.Date)
+        best = nearest_within_window(np.array(dates, dtype="datetime64[ns]"), date, case_duration_days)
+        if best >= 0:
+            case_ids.append(ids[best])
+            continue
+
+        # Kein Fall im Zeitfenster -> Neuer Fall, für spätere Elemente im Batch sichtbar
+        case_id = new_case_id()
+        dates.append(date)
+        ids.append(case_id)
+        case_ids.append(case_id)
+        new_rows.append((case_id, incoming.Patient_ID, incoming.Pathogen_code, pd.Timestamp(date)))
+
+    if new_rows:
+        new_df = pd.DataFrame(new_rows, columns=["case_ID", "Patient_ID", "Pathogen_code", "Date"])
+        falldatenprodukt = pd.concat([falldatenprodukt, new_df], ignore_index=True)
+
+    # (ID, case_ID)-Paare nur anhängen, wenn sie noch nicht existieren
+    pairs = pd.DataFrame({"ID": [i.ID for i in incomings], "case_ID": case_ids}).drop_duplicates()
+    pairs = pairs.merge(
+        fall_meldung_tabelle[["ID", "case_ID"]].drop_duplicates(),
+        on=["ID", "case_ID"],
+        how="left",
+        indicator=True,
+    )
+    pairs = pairs.loc[pairs["_merge"] == "left_only", ["ID", "case_ID"]]
+    if not pairs.empty:
+        fall_meldung_tabelle = pd.concat([fall_meldung_tabelle, pairs], ignore_index=True)
+
+    return case_ids, falldatenprodukt, fall_meldung_tabelle
+
+class CaseStore:
+    """
+    Spaltenorientierter Speicher für 'falldatenprodukt' + 'Fall_meldung_tabelle'
+    für den Streaming-Pfad (ein eingehendes Element pro Aufruf).
+
+    Statt boolescher Masken über ganze DataFrame-Spalten halten wir parallele
+    NumPy-Arrays plus Hash-Indizes:
+    - by_pp:   (Patient_ID, Pathogen_code) -> Zeilenindizes
+    - by_case: case_ID -> Zeilenindizes
+    - links:   case_ID -> Meldungs-IDs (dict als geordnete Menge)
+    Ein Lookup ist damit O(1) + kleiner Slice statt O(N) Spaltenscan.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.size = 0
+        self.patient_id = np.empty(capacity, dtype=object)
+        self.pathogen = np.empty(capacity, dtype=object)
+        self.date = np.empty(capacity, dtype="datetime64[ns]")
+        self.case_id = np.empty(capacity, dtype=object)
+        self.by_pp: Dict[Tuple[str, str], List[int]] = {}
+        self.by_case: Dict[str, List[int]] = {}
+        self.links: Dict[str, Dict[str, None]] = {}
+
+    @classmethod
+    def from_frames(cls, falldatenprodukt: pd.DataFrame, fall_meldung_tabelle: pd.DataFrame) -> "CaseStore":
+        """Baut den Speicher einmalig aus den bestehenden DataFrames auf."""
+        ensure_datetime(falldatenprodukt, "Date")
+        store = cls(capacity=max(1024, 2 * len(falldatenprodukt)))
+        dates = falldatenprodukt["Date"].to_numpy(dtype="datetime64[ns]")
+        for case_id, patient_id, pathogen, date in zip(
+            falldatenprodukt["case_ID"], falldatenprodukt["Patient_ID"],
+            falldatenprodukt["Pathogen_code"], dates
+        ):
+            store._append(case_id, patient_id, pathogen, date)
+        for meldung_id, case_id in zip(fall_meldung_tabelle["ID"], fall_meldung_tabelle["case_ID"]):
+            store.links.setdefault(case_id, {})[meldung_id] = None
+        return store
+
+    def _append(self, case_id: str, patient_id: str, pathogen: str, date) -> None:
+        # Kapazität verdoppeln -> amortisiert O(1) pro neuem Fall
+        if self.size == len(self.case_id):
+            capacity = 2 * max(1, self.size)
+            for name in ("patient_id", "pathogen", "date", "case_id"):
+                old = getattr(self, name)
+                grown = np.empty(capacity, dtype=old.dtype)
+                grown[:self.size] = old[:self.size]
+                setattr(self, name, grown)
+        row = self.size
+        self.patient_id[row] = patient_id
+        self.pathogen[row] = pathogen
+        self.date[row] = date
+        self.case_id[row] = case_id
+        self.by_pp.setdefault((patient_id, pathogen), []).append(row)
+        self.by_case.setdefault(case_id, []).append(row)
+        self.size += 1
+
+    def upsert(self, incoming: IncomingElement, case_duration_days: int = 28) -> str:
+        """
+        Gleiche Logik wie upsert_case_and_link_id: nächstliegender Fall im
+        Zeitfenster oder neuer Fall; danach (ID, case_ID) verknüpfen.
+        """
+        incoming_date = to_datetime64(incoming.Date)
+        idxs = self.by_pp.get((incoming.Patient_ID, incoming.Pathogen_code))
+        case_id = None
+        if idxs:
+            best = nearest_within_window(self.date[idxs], incoming_date, case_duration_days)
+            if best >= 0:
+                case_id = self.case_id[idxs[best]]
+        if case_id is None:
+            case_id = new_case_id()
+            self._append(case_id, incoming.Patient_ID, incoming.Pathogen_code, incoming_date)
+
+        self.links.setdefault(case_id, {})[incoming.ID] = None
+        return case_id
+
+    def ids_for_case(self, case_id: str) -> List[str]:
+        """Alle Meldungs-IDs, die zu case_id gehören."""
+        return list(self.links.get(case_id, ()))
+
+    def to_frames(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Exportiert den Speicher zurück nach (falldatenprodukt, Fall_meldung_tabelle)."""
+        n = self.size
+        falldatenprodukt = pd.DataFrame({
+            "case_ID": self.case_id[:n],
+            "Patient_ID": self.patient_id[:n],
+            "Pathogen_code": self.pathogen[:n],
+            "Date": self.date[:n],
+        })
+        fall_meldung_tabelle = pd.DataFrame(
+            [(meldung_id, case_id) for case_id, ids in self.links.items() for meldung_id in ids],
+            columns=["ID", "case_ID"],
+        )
+        return falldatenprodukt, fall_meldung_tabelle
+
 # ------------------------------
 # 4) Informationen (Labor/Klinik) je case_ID einsammeln
 # ------------------------------
@@ -129,7 +369,9 @@ def collect_case_evidence(
     falldatenprodukt: pd.DataFrame,
     fall_meldung_tabelle: pd.DataFrame,
     labordatenprodukt: pd.DataFrame,
-    klinikdatenprodukt: pd.DataFrame
+    klinikdatenprodukt: pd.DataFrame,
+    lab_by_id: Optional[Dict[str, List[int]]] = None,
+    klinik_by_id: Optional[Dict[str, List[int]]] = None
 ):
     """
     Schritte:
@@ -145,6 +387,9 @@ def collect_case_evidence(
         - interpretation == "Pos"  -> "sicherer Fall"
         - interpretation == "Neg"  -> "kein Fall"
         - sonst (interpretation leer/NaN) und manifestation vorhanden -> "wahrscheinlicher Fall"
+
+    lab_by_id / klinik_by_id: optionale, mit build_id_index vorab gebaute
+    Indizes; damit entfällt der Spaltenscan pro Aufruf.
     """
  
     # Datums-Felder in datetime konvertieren (sicher)
@@ -156,7 +401,7 @@ def collect_case_evidence(
     ids_for_case = fall_meldung_tabelle.loc[case_id_mask, "ID"].unique()
  
     # 2) LABOR: Zeilen für diese IDs filtern
-    lab_rows = labordatenprodukt[labordatenprodukt["ID"].isin(ids_for_case)].copy()
+    lab_rows = rows_for_ids(labordatenprodukt, ids_for_case, lab_by_id)
  
     lb_date = pd.NaT
     lb_interp = np.nan
@@ -167,7 +412,7 @@ def collect_case_evidence(
         lb_interp = lab_rows.loc[earliest_idx, "interpretation"]
  
     # 3) KLINIK: Zeilen für diese IDs filtern
-    klinik_rows = klinikdatenprodukt[klinikdatenprodukt["ID"].isin(ids_for_case)].copy()
+    klinik_rows = rows_for_ids(klinikdatenprodukt, ids_for_case, klinik_by_id)
  
     kb_date = pd.NaT
     kb_manifest = np.nan
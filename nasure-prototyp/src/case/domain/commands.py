@@ -6,7 +6,7 @@ from datetime import datetime
 from shared.domain.commands import Command
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateCaseFromDataProduct(Command):
     """Comand to create a new case in case management."""
     product_id: str
@@ -6,7 +6,7 @@ from datetime import datetime
 from shared.domain.commands import Event
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CaseCreated(Event):
     """Event raised when a case has been successfully created."""
     case_id: str
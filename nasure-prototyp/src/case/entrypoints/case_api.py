@@ -1,15 +1,15 @@
 """
 Case API Entrypoint - Thin API with Command Dispatch
 """
-import config
 from typing import Dict, Any, List
-from sqlalchemy import create_engine
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, RootModel
 import logging
+import orjson
 import os
 from datetime import datetime, timezone
-from case.service_layer.unit_of_work import SqlAlchemyUnitOfWork
+from case.service_layer.unit_of_work import ENGINE, SqlAlchemyUnitOfWork
 from case.adapters import orm
 
 logger = logging.getLogger(__name__)
@@ -23,8 +23,7 @@ app = FastAPI(
 # Initialize database and ORM mappers (Cosmic Python pattern)
 @app.on_event("startup")
 async def startup_event():
-    engine = create_engine(config.get_postgres_uri())
-    orm.metadata.create_all(engine)
+    orm.metadata.create_all(ENGINE)
     orm.start_mappers()
     logger.info("✓ Case Databases initialized")
 
@@ -99,6 +98,19 @@ class CreateCaseResponse(BaseModel):
 
 # ---------- Endpoints ----------
 
+def _case_to_dict(case) -> Dict[str, Any]:
+    """Plain dict in CaseResponse shape for direct orjson serialization."""
+    return {
+        "case_id": case.case_id,
+        "patient_id": case.patient_id,
+        "case_date": case.case_date,
+        "case_class": case.case_class,
+        "case_status": case.case_status,
+        "pathogen": case.pathogen,
+        "canton": case.canton,
+    }
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -163,33 +175,48 @@ def get_cases_by_patient_and_pathogen(patient_id: str, pathogen: str):
             # Get cases from repository
             cases = uow.cases.get_cases_by_patient_and_pathogen(patient_id, pathogen)
             
-            if not cases:
-                return CasesListResponse(cases=[], total_count=0)
-            
-            # Convert to response format
-            case_responses = [
-                CaseResponse(
-                    case_id=case.case_id,
-                    patient_id=case.patient_id,
-                    case_date=case.case_date,
-                    case_class=case.case_class,
-                    case_status=case.case_status,
-                    pathogen=case.pathogen,
-                    canton=case.canton
-                )
-                for case in cases
-            ]
+            # Rows come straight from the database and already have the
+            # CaseResponse shape, so serialize them with orjson and return the
+            # response directly instead of validating each row through pydantic.
+            case_responses = [_case_to_dict(case) for case in cases]
             
-            return CasesListResponse(
-                cases=case_responses,
-                total_count=len(case_responses)
-            )
+            return ORJSONResponse({
+                "cases": case_responses,
+                "total_count": len(case_responses)
+            })
             
     except Exception as e:
         logger.error(f"Error retrieving cases for patient {patient_id} and pathogen {pathogen}: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@app.get("/api/v1/cases/patient/{patient_id}/pathogen/{pathogen}/stream", summary="Stream cases by patient and pathogen as NDJSON")
+def stream_cases_by_patient_and_pathogen(patient_id: str, pathogen: str):
+    """
+    Stream all cases for a specific patient and pathogen, one JSON object per line.
+
+    Rows are fetched in batches from a server-side cursor and written as they
+    arrive, so memory stays bounded for patients with many cases.
+
+    Args:
+        patient_id: The patient's unique identifier
+        pathogen: The pathogen code to filter by
+
+    Returns:
+        application/x-ndjson stream of cases
+    """
+    def generate():
+        try:
+            with SqlAlchemyUnitOfWork() as uow:
+                for case in uow.cases.iter_cases_by_patient_and_pathogen(patient_id, pathogen):
+                    yield orjson.dumps(_case_to_dict(case)) + b"\n"
+        except Exception as e:
+            logger.error(f"Error streaming cases for patient {patient_id} and pathogen {pathogen}: {e}")
+            raise
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @app.post("/api/v1/cases", response_model=CreateCaseResponse, summary="Create a new case")
 def create_case(case_request: CreateCaseRequest):
     """
@@ -1,12 +1,14 @@
 """Redis event consumer for case mgmt service - listens to DataProductCreated events."""
 
-import json
 import logging
+import time
+from datetime import datetime
+from typing import List, Optional
+import orjson
 import redis
-from sqlalchemy import create_engine
 
 import config
-from case.service_layer import messagebus
+from case.service_layer import handlers, messagebus
 from case.domain import commands
 from case.service_layer.unit_of_work import SqlAlchemyUnitOfWork
 from case.adapters import orm
@@ -15,7 +17,13 @@ from case.adapters import orm
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-r = redis.Redis(**config.get_redis_host_and_port())
+r = redis.Redis(connection_pool=config.get_redis_pool())
+
+# Messages are drained from the pubsub socket and handled in batches:
+# a batch is flushed when it is full, when it has waited BATCH_TIMEOUT_SECONDS,
+# or when the channel goes idle.
+BATCH_SIZE = 128
+BATCH_TIMEOUT_SECONDS = 0.05
 
 
 def main():
@@ -27,25 +35,64 @@ def main():
 
     logger.info("Subscribed to 'surveillance:data-products' channel, waiting for messages...")
 
-    for m in pubsub.listen():
-        handle_data_product_created(m)
+    batch = []
+    deadline = 0.0
+    while True:
+        m = pubsub.get_message(timeout=BATCH_TIMEOUT_SECONDS)
+        if m is not None:
+            if not batch:
+                deadline = time.monotonic() + BATCH_TIMEOUT_SECONDS
+            batch.append(m)
+        if batch and (m is None or len(batch) >= BATCH_SIZE or time.monotonic() >= deadline):
+            handle_data_product_batch(batch)
+            batch = []
+
+
+def handle_data_product_batch(messages: List[dict]):
+    """
+    Handle a batch of DataProductCreated events from Redis.
+
+    All payloads are parsed first, then the resulting commands are dispatched
+    through one unit of work. Each command still commits on its own, so a
+    failing product does not roll back the rest of the batch and later
+    commands see cases created by earlier ones.
 
+    Errors are logged and the batch is dropped, so the consumer keeps listening.
 
-def handle_data_product_created(m):
+    Args:
+        messages: Redis message dictionaries
     """
-    Handle DataProductCreated event from Redis.
+    cmds = [cmd for cmd in map(parse_data_product_created, messages) if cmd is not None]
+    if not cmds:
+        return
+
+    try:
+        # Overlap the lab_dp round trips of the whole batch up front
+        handlers.prefetch_products([cmd.product_id for cmd in cmds])
+
+        uow = SqlAlchemyUnitOfWork()
+        results = messagebus.handle_many(cmds, uow)
+        logger.info("Processed batch of %d data products, results: %s", len(cmds), results)
+
+    except Exception as e:
+        logger.error("Error handling batch of %d data products: %s", len(cmds), e, exc_info=True)
 
-    When a data product is created in lab_dp, it publishes a DataProductCreated event
-    to Redis. This handler receives it and processes the event.
+
+def parse_data_product_created(m) -> Optional[commands.CreateCaseFromDataProduct]:
+    """
+    Build a CreateCaseFromDataProduct command from a DataProductCreated message.
 
     Args:
         m: Redis message dictionary
+
+    Returns:
+        The command, or None if the message is invalid (the reason is logged)
     """
     logger.info("Received message: %s", m)
 
     try:
         # Parse message data
-        data = json.loads(m["data"])
+        data = orjson.loads(m["data"])
 
         # Extract all available variables from the event
         product_id = data.get("product_id")
@@ -57,32 +104,28 @@ def handle_data_product_created(m):
         created_at_str = data.get("created_at")  # When the data product was created
 
         # Parse timestamps
-        from datetime import datetime
-        stored_at = datetime.fromisoformat(stored_at_str.replace('Z', '+00:00')) if stored_at_str else datetime.utcnow()
-        created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00')) if created_at_str else datetime.utcnow()
+        stored_at = datetime.fromisoformat(stored_at_str) if stored_at_str else datetime.utcnow()
+        created_at = datetime.fromisoformat(created_at_str) if created_at_str else datetime.utcnow()
 
         # Validate required fields
         if not product_id:
             logger.error("No product_id in message: %s", data)
-            return
+            return None
         if not patient_id:
             logger.error("No patient_id in message: %s", data)
-            return 
+            return None
         if not pathogen_code:
             logger.error("No pathogen_code in message: %s", data)
-            return
+            return None
 
-        logger.info(f"Processing DataProductCreated event:")
-        logger.info(f"  - product_id: {product_id}")
-        logger.info(f"  - patient_id: {patient_id}")
-        logger.info(f"  - pathogen_code: {pathogen_code}")
-        logger.info(f"  - pathogen_description: {pathogen_description}")
-        logger.info(f"  - timestamp: {timestamp}")
-        logger.info(f"  - stored_at: {stored_at}")
-        logger.info(f"  - created_at: {created_at}")
+        logger.info(
+            "Processing DataProductCreated event: product_id=%s, patient_id=%s, "
+            "pathogen_code=%s, pathogen_description=%s, timestamp=%s, stored_at=%s, created_at=%s",
+            product_id, patient_id, pathogen_code, pathogen_description, timestamp, stored_at, created_at
+        )
 
         # Create command to process the case
-        cmd = commands.CreateCaseFromDataProduct(
+        return commands.CreateCaseFromDataProduct(
             product_id=product_id,
             patient_id=patient_id,
             pathogen_code=pathogen_code,
@@ -92,16 +135,12 @@ def handle_data_product_created(m):
             created_at=created_at
         )
 
-        # Create unit of work and handle command
-        uow = SqlAlchemyUnitOfWork()
-        results = messagebus.handle(cmd, uow)
-
-        logger.info(f"Successfully processed product {product_id}, results: {results}")
-
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON from message: {e}")
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to parse JSON from message: %s", e)
     except Exception as e:
-        logger.error(f"Error handling created data product event: {e}", exc_info=True)
+        logger.error("Error parsing created data product event: %s", e, exc_info=True)
+    return None
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
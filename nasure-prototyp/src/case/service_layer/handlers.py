@@ -1,13 +1,24 @@
 import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Optional
+from uuid import uuid4
 from sqlalchemy import text
 import httpx
 
 
 from case.domain.commands import CreateCaseFromDataProduct
+from case.domain.domain import CaseRecord
 from case.service_layer.unit_of_work import AbstractUnitOfWork
+from lab_dp.adapters import redis_adapter
 
 logger = logging.getLogger(__name__)
 
+CASE_DURATION_DAYS = 28 # days window to match existing cases
+
 
 def create_case_from_data_product(
     command: CreateCaseFromDataProduct,
@@ -38,7 +49,7 @@ def create_case_from_data_product(
         case_id: The ID of the created case
         
     """
-    logger.info(f"Processing CreateCaseFromDataProduct command for product {command.product_id}")
+    logger.info("Processing CreateCaseFromDataProduct command for product %s", command.product_id)
 
     try:
         
@@ -49,15 +60,19 @@ def create_case_from_data_product(
             if not product:
                 raise ValueError(f"Data product {command.product_id} not found in lab_dp")  
 
-            logger.info(f"Fetched data product from lab_dp: {product}")
+            # The product repr is a full lab report; only build it when DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Fetched data product from lab_dp: %s", product)
 
-            # Step 2: fetch all cases for this patient and patogen
-            existing_cases = uow.cases.get_cases_by_patient_and_pathogen(
+            # Step 2: fetch the cases for this patient and patogen around the incoming date
+            existing_cases = uow.cases.get_cases_within_window(
                 command.patient_id, 
-                command.pathogen_code
+                command.pathogen_code,
+                parse_timestamp(command.timestamp),
+                CASE_DURATION_DAYS
             )
             
-            logger.info(f"Found {len(existing_cases)} existing cases for patient {command.patient_id} and pathogen {command.pathogen_code}")
+            logger.info("Found %s candidate cases for patient %s and pathogen %s", len(existing_cases), command.patient_id, command.pathogen_code)
             
             # Step 3: Find or create case
             case_id = find_or_create_case(existing_cases, product, command, uow)
@@ -66,55 +81,53 @@ def create_case_from_data_product(
             uow.commit()
 
             #TODO chech if new case was created or existing one updated 
-            logger.info(f"Committed case {case_id} to database")
+            logger.info("Committed case %s to database", case_id)
 
-        logger.info(f"Successfully created/updated case {case_id} from product {command.product_id}")
+        logger.info("Successfully created/updated case %s from product %s", case_id, command.product_id)
         return case_id
 
     except Exception as e:
-        logger.error(f"Unexpected error processing product {command.product_id}: {e}")
+        logger.error("Unexpected error processing product %s: %s", command.product_id, e)
         raise
 
+@lru_cache(maxsize=4096)
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp string (fromisoformat accepts a trailing 'Z' since 3.11).
+
+    Cached because the same case dates are compared again for every new
+    product of a patient/pathogen.
+    """
+    return datetime.fromisoformat(value)
+
 def find_or_create_case(existing_cases: list, product: dict, command: CreateCaseFromDataProduct, uow: AbstractUnitOfWork) -> str:
     """Find existing case within duration or create new one."""
-    from datetime import datetime, timedelta
-    
-    CASE_DURATION_DAYS = 28 # days window to match existing cases
-    
     # Parse incoming date
     #TODO: timestamp should be changed to collection date of lab sample
-    incoming_date = datetime.fromisoformat(command.timestamp.replace('Z', '+00:00'))
+    incoming_date = parse_timestamp(command.timestamp)
     
-    # Filter cases within duration window
-    matching_cases = []
+    # Single pass: keep the case with the smallest date difference within the window
+    closest_case = None
+    closest_diff = None
     for case in existing_cases:
-        case_date = datetime.fromisoformat(case.case_date)
-        date_diff = abs((incoming_date - case_date).days)
+        date_diff = abs((incoming_date - parse_timestamp(case.case_date)).days)
         
-        if date_diff <= CASE_DURATION_DAYS:
-            matching_cases.append({
-                "case": case,
-                "date_diff": date_diff
-            })
+        if date_diff <= CASE_DURATION_DAYS and (closest_diff is None or date_diff < closest_diff):
+            closest_case = case
+            closest_diff = date_diff
     
-    if matching_cases:
-        # Find case with smallest date difference
-        closest_case = min(matching_cases, key=lambda x: x["date_diff"])
-        case_id = closest_case["case"].case_id
+    if closest_case is not None:
+        case_id = closest_case.case_id
         
-        logger.info(f"Reusing existing case {case_id} (date diff: {closest_case['date_diff']} days)")
+        logger.info("Reusing existing case %s (date diff: %s days)", case_id, closest_diff)
         return case_id
     else:
         # Create new case internally
         case_id = create_new_case_internal(product, command, uow)
-        logger.info(f"Created new case {case_id}")
+        logger.info("Created new case %s", case_id)
         return case_id
 
 def create_new_case_internal(product: dict, command: CreateCaseFromDataProduct, uow: AbstractUnitOfWork) -> str:
     """Create a new case using internal repository."""
-    from uuid import uuid4
-    from case.domain.domain import CaseRecord
-    
     case_id = str(uuid4())
     
     new_case = CaseRecord(
@@ -143,42 +156,89 @@ def publish_case_created_event(event, uow: AbstractUnitOfWork):
         event: CaseCreated event
         uow: Unit of work
     """
-    logger.info(f"Publishing CaseCreated event for case {event.case_id}")
+    logger.info("Publishing CaseCreated event for case %s", event.case_id)
     try:
-        # Import here to avoid circular dependency
-        from lab_dp.adapters import redis_adapter
-
         redis_adapter.publish("surveillance:cases", event)
-        logger.info(f"Published CaseCreated event for {event.case_id}")
+        logger.info("Published CaseCreated event for %s", event.case_id)
 
     except Exception as e:
-        logger.error(f"Failed to publish CaseCreated event for {event.case_id}: {e}")
+        logger.error("Failed to publish CaseCreated event for %s: %s", event.case_id, e)
         # Don't re-raise - external failures shouldn't break the flow
 
-from typing import Optional
+# Shared keep-alive client so each product fetch reuses pooled connections to lab_dp
+LAB_DP_CLIENT = httpx.Client(
+    base_url=os.getenv("LAB_DP_URL", "http://lab-dp-api:8001"),
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+
+# Data products are immutable once created, so replayed or retried events
+# can reuse an earlier fetch. Misses (404) are not cached.
+PRODUCT_CACHE_SIZE = 4096
+_product_cache: "OrderedDict[str, dict]" = OrderedDict()
+
+# Worker threads for fetching a batch of products concurrently
+PREFETCH_WORKERS = 16
+_prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="lab-dp-prefetch")
 
 def fetch_product_from_lab_dp(product_id: str) -> Optional[dict]:
-    """Fetch product data from lab_dp API."""
+    """Fetch product data from lab_dp API (LRU-cached per product_id)."""
+    product = _product_cache.get(product_id)
+    if product is not None:
+        _product_cache.move_to_end(product_id)
+        return product
+
+    product = _request_product(product_id)
+    if product is not None:
+        _cache_product(product_id, product)
+    return product
+
+def prefetch_products(product_ids: List[str]):
+    """
+    Fetch the not yet cached products of a batch concurrently.
+
+    The HTTP round trips overlap on the prefetch threads; the results land in
+    the product cache, so the (sequential) command handlers find them there.
+    Failures are only logged here - the handler retries the fetch and reports
+    the error for its own product.
+    """
+    missing = [product_id for product_id in dict.fromkeys(product_ids) if product_id not in _product_cache]
+    if len(missing) < 2:
+        return
+
+    for product_id, product in zip(missing, _prefetch_executor.map(_try_request_product, missing)):
+        if product is not None:
+            _cache_product(product_id, product)
+
+def _cache_product(product_id: str, product: dict):
+    _product_cache[product_id] = product
+    if len(_product_cache) > PRODUCT_CACHE_SIZE:
+        _product_cache.popitem(last=False)
+
+def _try_request_product(product_id: str) -> Optional[dict]:
+    try:
+        return _request_product(product_id)
+    except Exception as e:
+        logger.warning("Prefetch of product %s failed: %s", product_id, e)
+        return None
+
+def _request_product(product_id: str) -> Optional[dict]:
+    """GET a product from lab_dp; None if it does not exist."""
     try:
-        # Use environment variable for lab_dp URL
-        import os
-        lab_dp_url = os.getenv("LAB_DP_URL", "http://lab-dp-api:8001")
+        response = LAB_DP_CLIENT.get(f"/api/v1/data-product/{product_id}")
         
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(f"{lab_dp_url}/api/v1/data-product/{product_id}")
+        if response.status_code == 404:
+            logger.error("Product %s not found in lab_dp", product_id)
+            return None
             
-            if response.status_code == 404:
-                logger.error(f"Product {product_id} not found in lab_dp")
-                return None
-                
-            response.raise_for_status()
-            return response.json()
+        response.raise_for_status()
+        return response.json()
             
     except httpx.RequestError as e:
-        logger.error(f"Failed to connect to lab_dp API: {e}")
+        logger.error("Failed to connect to lab_dp API: %s", e)
         raise
     except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error from lab_dp API: {e}")
+        logger.error("HTTP error from lab_dp API: %s", e)
         raise
 
 def extract_case_data_from_product(product_data: dict, command: CreateCaseFromDataProduct) -> dict:
@@ -20,9 +20,12 @@ class AbstractUnitOfWork(abc.ABC):
         self._commit()
 
     def collect_new_events(self):
-        for product in self.cases.seen:
-            while product.events:
-                yield product.events.pop(0)
+        for case in self.cases.seen.values():
+            events = getattr(case, "events", None)
+            if events:
+                drained = events[:]
+                events.clear()
+                yield from drained
 
     @abc.abstractmethod
     def _commit(self):
@@ -33,13 +36,21 @@ class AbstractUnitOfWork(abc.ABC):
         raise NotImplementedError
 
 
-DEFAULT_SESSION_FACTORY = sessionmaker(
-    bind=create_engine(
-        config.get_postgres_uri(),
-        isolation_level="REPEATABLE READ",
-    )
+# One pooled engine per process, shared by every unit of work.
+# pool_pre_ping drops connections closed by the server (or a pooler such as
+# PgBouncer) before use; pool_recycle retires them before idle timeouts hit.
+ENGINE = create_engine(
+    config.get_postgres_uri(),
+    isolation_level="REPEATABLE READ",
+    insertmanyvalues_page_size=10_000,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=1800,
 )
 
+DEFAULT_SESSION_FACTORY = sessionmaker(bind=ENGINE)
+
 class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
     def __init__(self, session_factory=DEFAULT_SESSION_FACTORY):
         self.session_factory = session_factory
@@ -1,6 +1,13 @@
 """Configuration settings for lab data product."""
 
 import os
+from functools import lru_cache
+from types import MappingProxyType
+
+import redis
+
+# Upper bound on sockets the shared Redis pool may open per process
+REDIS_MAX_CONNECTIONS = 64
 
 
 def get_postgres_uri():
@@ -13,11 +20,19 @@ def get_postgres_uri():
     return f"postgresql://{user}:{password}@{host}:{port}/{db_name}"
 
 
+@lru_cache(maxsize=1)
 def get_redis_host_and_port():
-    """Get Redis connection details from environment variables."""
+    """Get Redis connection details from environment variables (read once per process)."""
     host = os.environ.get("REDIS_HOST", "localhost")
     port = 6379 if host == "localhost" else 6379
-    return dict(host=host, port=port)
+    # Read-only, so callers cannot modify the cached settings
+    return MappingProxyType(dict(host=host, port=port))
+
+
+@lru_cache(maxsize=1)
+def get_redis_pool() -> redis.ConnectionPool:
+    """Get the process-wide Redis connection pool shared by all Redis clients."""
+    return redis.ConnectionPool(**get_redis_host_and_port(), max_connections=REDIS_MAX_CONNECTIONS)
 
 
 def get_redis_url():
@@ -26,8 +41,9 @@ def get_redis_url():
     return f"redis://{redis_config['host']}:{redis_config['port']}"
 
 
+@lru_cache(maxsize=1)
 def get_minio_config():
-    """Get MinIO connection configuration from environment variables."""
+    """Get MinIO connection configuration from environment variables (read once per process)."""
     host = os.environ.get("MINIO_HOST", "localhost")
     endpoint = f"{host}:9000" if host == "localhost" else f"{host}:9000"
     access_key = os.environ.get("MINIO_ACCESS_KEY", "minioadmin")
@@ -35,17 +51,19 @@ def get_minio_config():
     bucket_name = os.environ.get("MINIO_BUCKET", "lab-raw-data")
     secure = os.environ.get("MINIO_SECURE", "false").lower() == "true"
 
-    return dict(
+    # Read-only, so callers cannot modify the cached settings
+    return MappingProxyType(dict(
         endpoint=endpoint,
         access_key=access_key,
         secret_key=secret_key,
         bucket_name=bucket_name,
         secure=secure
-    )
+    ))
 
 
+@lru_cache(maxsize=1)
 def get_api_url():
-    """Get API URL from environment variables."""
+    """Get API URL from environment variables (read once per process)."""
     host = os.environ.get("API_HOST", "localhost")
     port = 8000 if host == "localhost" else 8000
     return f"http://{host}:{port}"
\ No newline at end of file
@@ -1,29 +1,20 @@
 """Redis adapter for publishing events following Cosmic Python pattern."""
 
-import json
 import logging
-from dataclasses import asdict
-from datetime import datetime
+import orjson
 import redis
 
-from config import get_redis_host_and_port
+from config import get_redis_pool
 from shared.domain.commands import Event
 
 logger = logging.getLogger(__name__)
 
-r = redis.Redis(**get_redis_host_and_port())
+r = redis.Redis(connection_pool=get_redis_pool())
 
 
-def _serialize_event(event: Event) -> str:
-    """Serialize event to JSON, handling datetime objects."""
-    event_dict = asdict(event)
-
-    # Convert datetime objects to ISO strings
-    for key, value in event_dict.items():
-        if isinstance(value, datetime):
-            event_dict[key] = value.isoformat()
-
-    return json.dumps(event_dict)
+def _serialize_event(event: Event) -> bytes:
+    """Serialize event to JSON; orjson encodes dataclasses and datetimes (ISO 8601) natively."""
+    return orjson.dumps(event)
 
 
 def publish(channel: str, event: Event):
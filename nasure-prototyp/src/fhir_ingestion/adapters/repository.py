@@ -1,36 +1,54 @@
 """Repository pattern implementation following Cosmic Python approach."""
 
 import abc
-import json
 import logging
+import os
+import time
 from io import BytesIO
-from typing import Set, Dict, Any, Optional, List
-from datetime import datetime
+from typing import Dict, Any, Optional, List
 
+import orjson
 from minio import Minio
 from minio.error import S3Error
+from redis import Redis
+from redis.exceptions import RedisError
 
 from fhir_ingestion.domain.model import FhirBundle
 
 logger = logging.getLogger(__name__)
 
+# Redis hash mapping bundle_id -> object_key, so lookups by ID skip the bucket LIST
+BUNDLE_INDEX_KEY = "fhir:bundle_index"
+
+
+def new_object_id() -> str:
+    """
+    Time-ordered unique ID in the UUIDv7 layout (48-bit ms timestamp + random bits).
+
+    Sorts lexicographically by creation time and does not collide within a second
+    like a strftime timestamp would.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return f"{value:032x}"
+
 
 class AbstractMinioRepository(abc.ABC):
     """Abstract repository class"""
 
     def __init__(self):
-        self.seen = set()  # type: Set[FhirBundle]
+        self.seen = {}  # type: Dict[str, FhirBundle]
 
     def add(self, bundle: FhirBundle) -> str:
         object_key = self._add(bundle)
-        self.seen.add(bundle)
+        self.seen[bundle.bundle_id] = bundle
         return object_key
 
     def get(self, object_key: str):
-        bundle = self._get(object_key)
-        if bundle:
-            self.seen.add(bundle)
-        return bundle
+        # Returns the raw bundle data; only FhirBundle entities (which carry
+        # events) are tracked in seen
+        return self._get(object_key)
 
     def get_by_bundle_id(self, bundle_id: str):
         """Get bundle by bundle ID."""
@@ -55,10 +73,11 @@ class AbstractMinioRepository(abc.ABC):
 class MinIORepository(AbstractMinioRepository):
     """MinIO implementation of the repository pattern."""
 
-    def __init__(self, client: Minio, bucket_name: str = "lab-raw-data"):
+    def __init__(self, client: Minio, bucket_name: str = "lab-raw-data", index: Optional[Redis] = None):
         super().__init__()
         self.client = client
         self.bucket_name = bucket_name
+        self.index = index
         self._ensure_bucket_exists()
 
     def _ensure_bucket_exists(self):
@@ -74,23 +93,23 @@ class MinIORepository(AbstractMinioRepository):
     def _add(self, bundle: FhirBundle) -> str:
         """Store FHIR bundle in MinIO."""
         try:
-            # Generate object key with timestamp for uniqueness
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            object_key = f"fhir_bundles/{timestamp}_{bundle.bundle_id}.json"
+            # Time-ordered ID keeps keys unique and sorted by arrival
+            object_key = f"fhir_bundles/{new_object_id()}_{bundle.bundle_id}.json"
 
-            # Convert bundle to JSON bytes
-            bundle_json = json.dumps(bundle.bundle_data, indent=2)
-            bundle_bytes = BytesIO(bundle_json.encode('utf-8'))
+            # orjson emits UTF-8 bytes directly; length must be the byte count
+            payload = orjson.dumps(bundle.bundle_data)
 
             # Store in MinIO
             self.client.put_object(
                 bucket_name=self.bucket_name,
                 object_name=object_key,
-                data=bundle_bytes,
-                length=len(bundle_json),
+                data=BytesIO(payload),
+                length=len(payload),
                 content_type="application/json"
             )
 
+            self._index_object_key(bundle.bundle_id, object_key)
+
             # Call domain method to mark as stored and generate events
             bundle.store(object_key)
 
@@ -105,8 +124,7 @@ class MinIORepository(AbstractMinioRepository):
         """Retrieve FHIR bundle from MinIO."""
         try:
             response = self.client.get_object(self.bucket_name, object_key)
-            bundle_json = response.read().decode('utf-8')
-            bundle_data = json.loads(bundle_json)
+            bundle_data = orjson.loads(response.read())
 
             logger.info(f"Retrieved FHIR bundle from {object_key}")
             return bundle_data
@@ -119,8 +137,36 @@ class MinIORepository(AbstractMinioRepository):
                 response.close()
                 response.release_conn()
 
+    def _index_object_key(self, bundle_id: str, object_key: str):
+        """Record bundle_id -> object_key in the index (best effort)."""
+        if self.index is None:
+            return
+        try:
+            self.index.hset(BUNDLE_INDEX_KEY, bundle_id, object_key)
+        except RedisError as e:
+            # The bundle is stored; a missing entry only costs a LIST on lookup
+            logger.warning(f"Failed to index bundle {bundle_id}: {e}")
+
+    def _lookup_object_key(self, bundle_id: str) -> Optional[str]:
+        """Look up the object key of a bundle in the index."""
+        if self.index is None:
+            return None
+        try:
+            object_key = self.index.hget(BUNDLE_INDEX_KEY, bundle_id)
+        except RedisError as e:
+            logger.warning(f"Bundle index lookup failed for {bundle_id}: {e}")
+            return None
+        if isinstance(object_key, bytes):
+            object_key = object_key.decode('utf-8')
+        return object_key
+
     def _get_by_bundle_id(self, bundle_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve FHIR bundle by bundle ID from MinIO."""
+        object_key = self._lookup_object_key(bundle_id)
+        if object_key:
+            return self._get(object_key)
+
+        # Not indexed (e.g. stored before the index existed): fall back to a LIST
         try:
             # List objects matching the pattern: fhir_bundles/*_{bundle_id}.json
             prefix = "fhir_bundles/"
@@ -131,6 +177,7 @@ class MinIORepository(AbstractMinioRepository):
             for obj in objects:
                 if obj.object_name.endswith(suffix):
                     # Found the bundle, retrieve it using existing _get method
+                    self._index_object_key(bundle_id, obj.object_name)
                     bundle_data = self._get(obj.object_name)
                     logger.info(f"Retrieved bundle {bundle_id} from {obj.object_name}")
                     return bundle_data
@@ -7,7 +7,7 @@ from datetime import datetime
 from shared.domain.commands import Command
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StoreFHIRBundle(Command):
     """Command to store raw FHIR bundle in MinIO."""
     bundle_id: str
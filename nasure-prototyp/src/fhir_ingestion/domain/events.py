@@ -7,7 +7,7 @@ from typing import Dict, Any
 from shared.domain.commands import Event
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BundleStored(Event):
     """Event raised when a FHIR bundle has been successfully stored in MinIO."""
     bundle_id: str
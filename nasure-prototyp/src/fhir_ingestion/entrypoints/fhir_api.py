@@ -6,16 +6,18 @@ import uuid
 from datetime import datetime, timezone
 from typing import Dict, Any
 
-from fastapi import FastAPI, HTTPException, Request
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request
 from pydantic import BaseModel
 import logging
 
 from fhir_ingestion.domain.commands import StoreFHIRBundle
+from fhir_ingestion.logging_setup import configure_queue_logging, stop_queue_logging
 from fhir_ingestion.service_layer import messagebus, views
 from fhir_ingestion.service_layer.unit_of_work import FHIRIngestionUnitOfWork
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging; records are written by a background listener thread
+configure_queue_logging(logging.INFO)
 logger = logging.getLogger(__name__)
 
 app = FastAPI(
@@ -25,6 +27,11 @@ app = FastAPI(
 )
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    stop_queue_logging()
+
+
 class IngestionResponse(BaseModel):
     """Response model for successful ingestion"""
     status: str
@@ -43,8 +50,35 @@ async def health_check():
     }
 
 
-@app.post("/api/v1/fhir/ingest", response_model=IngestionResponse)
-def ingest_fhir_bundle(bundle: Dict[str, Any], source_system: str = "ch-elm"):
+async def parse_fhir_bundle(request: Request) -> Dict[str, Any]:
+    """
+    Parse the raw request body as a FHIR JSON bundle.
+
+    Uses orjson directly instead of FastAPI's stdlib json decode followed by
+    pydantic validation of Dict[str, Any], which walks the whole bundle again.
+    """
+    try:
+        bundle = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid JSON: {e}")
+
+    if not isinstance(bundle, dict):
+        raise HTTPException(status_code=422, detail="FHIR bundle must be a JSON object")
+
+    return bundle
+
+
+@app.post(
+    "/api/v1/fhir/ingest",
+    response_model=IngestionResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"type": "object"}}}
+        }
+    }
+)
+async def ingest_fhir_bundle(bundle: Dict[str, Any] = Depends(parse_fhir_bundle), source_system: str = "ch-elm"):
     """
     Ingest CH-eLM FHIR Bundle - Thin API with command dispatch.
 
@@ -71,9 +105,10 @@ def ingest_fhir_bundle(bundle: Dict[str, Any], source_system: str = "ch-elm"):
 
         # Handle command through dedicated FHIR ingestion message bus
         uow = FHIRIngestionUnitOfWork()
-        results = messagebus.handle(cmd, uow)
+        # Handlers run on the executor; BundleStored handlers overlap their I/O
+        result = await messagebus.handle_async(cmd, uow)
 
-        logger.info(f"Command processed for bundle {bundle_id}, results: {results}")
+        logger.info(f"Command processed for bundle {bundle_id}, result: {result}")
 
         return IngestionResponse(
             status="accepted",
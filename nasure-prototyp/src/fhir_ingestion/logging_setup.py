@@ -0,0 +1,44 @@
+"""Queue-based logging so request and dispatch paths never block on handler I/O."""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+
+
+def configure_queue_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route root logging through an in-memory queue drained by a background thread.
+
+    The handlers basicConfig would install (stderr stream handler) are moved
+    behind a QueueListener; the root logger itself only gets a QueueHandler, so
+    logger.info/exception calls are reduced to an enqueue.
+
+    Call stop_queue_logging() at shutdown to flush pending records.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    logging.basicConfig(level=level)
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    for handler in handlers:
+        root.removeHandler(handler)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_queue_logging():
+    """Flush queued records and stop the background logging thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -2,8 +2,12 @@
 """Message bus for FHIR ingestion service following Cosmic Python pattern."""
 
 from __future__ import annotations
+import asyncio
+import functools
 import logging
-from typing import List, Dict, Callable, Type, Union, TYPE_CHECKING
+from collections import deque
+from types import MappingProxyType
+from typing import Deque, List, Callable, Mapping, Tuple, Type, Union, TYPE_CHECKING
 
 from shared.domain.commands import Command, Event
 from fhir_ingestion.domain.commands import StoreFHIRBundle
@@ -17,42 +21,133 @@ logger = logging.getLogger(__name__)
 
 Message = Union[StoreFHIRBundle, BundleStored]
 
+# Upper bound on event handlers running at the same time in handle_async
+EVENT_HANDLER_CONCURRENCY = 8
+
 
 def handle(
     message: Message,
     uow: FHIRIngestionUnitOfWork,
 ):
-    """Handle message (command or event) with the appropriate handler."""
-    results = []
-    queue = [message]
+    """
+    Handle message (command or event) with the appropriate handler.
+
+    Returns the command handler's result, or None if message is an event.
+    Only the initial message can be a command - the queue only grows with
+    events - so there is at most one result.
+    """
+    command_result = None
+    queue = deque([message])
 
     while queue:
-        message = queue.pop(0)
+        message = queue.popleft()
+
+        # Exact-type lookup replaces the isinstance(Event)/isinstance(Command) chain
+        dispatch = DISPATCH.get(type(message))
+        if dispatch is None:
+            raise Exception(f"{message} was not a registered Event or Command")
+        handle_message, is_command = dispatch
+        result = handle_message(message, queue, uow)
+        if is_command:
+            command_result = result
 
-        if isinstance(message, Event):
-            handle_event(message, queue, uow)
-        elif isinstance(message, Command):
-            cmd_result = handle_command(message, queue, uow)
-            results.append(cmd_result)
-        else:
-            raise Exception(f"{message} was not an Event or Command")
+    return command_result
+
+
+async def handle_async(
+    message: Message,
+    uow: FHIRIngestionUnitOfWork,
+    concurrency: int = EVENT_HANDLER_CONCURRENCY,
+):
+    """
+    Async variant of handle() for callers running on an event loop.
+
+    Commands run one at a time on the default executor. Consecutive queued
+    events are dispatched as a batch: all of their handlers run concurrently
+    (at most `concurrency` at once), so the I/O of independent handlers such
+    as the Redis publish overlaps. Each concurrent handler gets its own fresh
+    unit of work of the same type as `uow`; the command's unit of work is
+    never shared across threads. The sync handlers are reused unchanged.
+    Returns the command result like handle().
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    command_result = None
+    queue = deque([message])
+
+    while queue:
+        message = queue.popleft()
+
+        dispatch = DISPATCH.get(type(message))
+        if dispatch is None:
+            raise Exception(f"{message} was not a registered Event or Command")
+        if dispatch[1]:
+            command_result = await loop.run_in_executor(
+                None, functools.partial(handle_command, message, queue, uow)
+            )
+            continue
 
-    return results
+        events = [message]
+        while queue and type(queue[0]) in EVENT_HANDLERS:
+            events.append(queue.popleft())
+        queue.extend(await handle_events_async(events, uow, semaphore))
+
+    return command_result
+
+
+async def handle_events_async(
+    events: List[Event],
+    uow: FHIRIngestionUnitOfWork,
+    semaphore: asyncio.Semaphore,
+) -> List[Event]:
+    """
+    Run the handlers of all given events concurrently; failures are logged like in handle_event.
+
+    Every handler runs with a new unit of work of `uow`'s type. Returns the
+    events the handlers raised.
+    """
+    uow_factory = type(uow)
+    results = await asyncio.gather(*(
+        _run_event_handler(handler, event, uow_factory(), semaphore)
+        for event in events
+        for handler in EVENT_HANDLERS.get(type(event), ())
+    ))
+    return [new_event for new_events in results for new_event in new_events]
+
+
+async def _run_event_handler(
+    handler: Callable,
+    event: Event,
+    uow: FHIRIngestionUnitOfWork,
+    semaphore: asyncio.Semaphore,
+) -> List[Event]:
+    """Run one sync event handler on the default executor with its own unit of work."""
+    async with semaphore:
+        try:
+            logger.info("calling handler %s for event %s", handler.__name__, type(event).__name__)
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(handler, event, uow=uow)
+            )
+            return uow.collect_new_events()
+        except Exception:
+            logger.exception("Exception handling event %s", event)
+            return []
 
 
 def handle_event(
     event: Event,
-    queue: List[Message],
+    queue: Deque[Message],
     uow: FHIRIngestionUnitOfWork,
 ):
     """Handle event by calling all registered event handlers."""
-    logger.info(f"handling event {type(event).__name__} with {len(EVENT_HANDLERS.get(type(event), []))} handlers")
-    for handler in EVENT_HANDLERS[type(event)]:
+    event_handlers = EVENT_HANDLERS.get(type(event), ())
+    logger.info("handling event %s with %d handlers", type(event).__name__, len(event_handlers))
+    for handler in event_handlers:
         try:
-            logger.info(f"calling handler {handler.__name__} for event {type(event).__name__}")
+            logger.info("calling handler %s for event %s", handler.__name__, type(event).__name__)
             handler(event, uow=uow)
             new_events = uow.collect_new_events()
-            logger.info(f"Handler {handler.__name__} generated {len(new_events)} new events")
+            logger.info("Handler %s generated %d new events", handler.__name__, len(new_events))
             queue.extend(new_events)
         except Exception:
             logger.exception("Exception handling event %s", event)
@@ -61,16 +156,17 @@ def handle_event(
 
 def handle_command(
     command: Command,
-    queue: List[Message],
+    queue: Deque[Message],
     uow: FHIRIngestionUnitOfWork,
 ):
     """Handle command by calling the registered command handler."""
-    logger.info(f"handling command {command}")
+    logger.info("handling command %s", command)
     try:
         handler = COMMAND_HANDLERS[type(command)]
         result = handler(command, uow=uow)
         new_events = uow.collect_new_events()
-        logger.info(f"Collected {len(new_events)} events after command: {[type(e).__name__ for e in new_events]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Collected %d events after command: %s", len(new_events), [type(e).__name__ for e in new_events])
         queue.extend(new_events)
         return result
     except Exception:
@@ -79,14 +175,20 @@ def handle_command(
 
 
 # Event handlers - individual event handlers
-EVENT_HANDLERS = {
-    BundleStored: [
+EVENT_HANDLERS = MappingProxyType({
+    BundleStored: (
         handlers.bundle_stored,
         handlers.publish_stored_event,
-    ],
-}  # type: Dict[Type[Event], List[Callable]]
+    ),
+})  # type: Mapping[Type[Event], Tuple[Callable, ...]]
 
 # Command handlers - single handler per command type
-COMMAND_HANDLERS = {
+COMMAND_HANDLERS = MappingProxyType({
     StoreFHIRBundle: handlers.store_fhir_bundle,
-}  # type: Dict[Type[Command], Callable]
\ No newline at end of file
+})  # type: Mapping[Type[Command], Callable]
+
+# Dispatch table built once at import: message type -> (handle_* function, is_command)
+DISPATCH = MappingProxyType({
+    **{event_type: (handle_event, False) for event_type in EVENT_HANDLERS},
+    **{command_type: (handle_command, True) for command_type in COMMAND_HANDLERS},
+})  # type: Mapping[type, Tuple[Callable, bool]]
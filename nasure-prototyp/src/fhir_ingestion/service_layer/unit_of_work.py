@@ -1,14 +1,48 @@
 """Unit of Work implementation for FHIR ingestion service."""
 
+import os
+from functools import lru_cache
 from typing import List
+
+import certifi
+import urllib3
 from minio import Minio
 
 from shared.service_layer.unit_of_work import AbstractUnitOfWork
 from fhir_ingestion.adapters.repository import MinIORepository
+from fhir_ingestion.adapters import redis_adapter
 from shared.domain.commands import Event
 from config import get_minio_config
 
 
+@lru_cache(maxsize=1)
+def _get_minio_client() -> Minio:
+    """
+    Build the process-wide MinIO client on first use.
+
+    Every unit of work reuses it, so its urllib3 pool (and open connections)
+    is created once instead of per `with uow:` block. Pool settings mirror
+    the Minio defaults apart from the pool sizes.
+    """
+    minio_config = get_minio_config()
+    timeout = 300
+    http_client = urllib3.PoolManager(
+        num_pools=4,
+        maxsize=16,
+        timeout=urllib3.util.Timeout(connect=timeout, read=timeout),
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    )
+    return Minio(
+        endpoint=minio_config["endpoint"],
+        access_key=minio_config["access_key"],
+        secret_key=minio_config["secret_key"],
+        secure=minio_config["secure"],
+        http_client=http_client,
+    )
+
+
 class FHIRIngestionUnitOfWork(AbstractUnitOfWork):
     """Unit of Work implementation for FHIR ingestion operations."""
 
@@ -18,17 +52,12 @@ class FHIRIngestionUnitOfWork(AbstractUnitOfWork):
         self.events: List[Event] = []  # Collect events during transaction
 
     def __enter__(self):
-        # Initialize MinIO client from config
-        minio_config = get_minio_config()
-        self._minio_client = Minio(
-            endpoint=minio_config["endpoint"],
-            access_key=minio_config["access_key"],
-            secret_key=minio_config["secret_key"],
-            secure=minio_config["secure"]
-        )
+        # Shared MinIO client; only the repository is per unit of work
+        self._minio_client = _get_minio_client()
         self.bundles = MinIORepository(
             client=self._minio_client,
-            bucket_name=minio_config["bucket_name"]
+            bucket_name=get_minio_config()["bucket_name"],
+            index=redis_adapter.r
         )
 
         return super().__enter__()
@@ -39,14 +68,17 @@ class FHIRIngestionUnitOfWork(AbstractUnitOfWork):
 
     def collect_new_events(self) -> List[Event]:
         """Collect events from domain entities and clear them."""
-        # Collect events from domain entities (like Cosmic Python)
-        for bundle in self.bundles.seen:
-            while bundle.events:
-                self.events.append(bundle.events.pop(0))
+        # Collect events from domain entities (like Cosmic Python); a unit of
+        # work that was never entered has no repository yet
+        if self.bundles is not None:
+            for bundle in self.bundles.seen.values():
+                if bundle.events:
+                    self.events.extend(bundle.events)
+                    bundle.events.clear()
 
-        # Return and clear collected events
-        events = self.events[:]
-        self.events.clear()
+        # Return collected events and start a fresh list
+        events = self.events
+        self.events = []
         return events
 
     def _commit(self):
@@ -61,6 +93,6 @@ class FHIRIngestionUnitOfWork(AbstractUnitOfWork):
         self.events.clear()
 
     def _close_connections(self):
-        """Close all open connections."""
-        # MinIO client doesn't require explicit closing
+        """Release this unit of work's reference to the shared client."""
+        # The pooled MinIO client stays open for the next unit of work
         self._minio_client = None
\ No newline at end of file
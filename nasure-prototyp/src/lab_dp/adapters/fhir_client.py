@@ -2,14 +2,69 @@
 
 import abc
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Tuple
+import ijson
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import config
 
 logger = logging.getLogger(__name__)
 
 
+def create_session() -> requests.Session:
+    """Create a keep-alive session that retries idempotent GETs on transient gateway errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,  # hand the final response to raise_for_status
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by all clients - a unit of work builds a new client per message,
+# so a per-instance session would still reconnect for every bundle.
+SESSION = create_session()
+
+# ijson scalar events for top-level bundle fields
+_SCALAR_EVENTS = frozenset(("string", "number", "boolean", "null"))
+
+
+def iter_bundle_items(stream) -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally parse a FHIR bundle JSON stream.
+
+    Yields ("entry", entry) for each element of the bundle's "entry" array and
+    (key, value) for each scalar top-level field (e.g. "timestamp"). Only one
+    entry is materialized at a time instead of the whole bundle.
+    """
+    builder = None
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "entry.item" and event in ("end_map", "end_array"):
+                yield "entry", builder.value
+                builder = None
+        elif prefix == "entry.item":
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            else:
+                yield "entry", value
+        elif event in _SCALAR_EVENTS and "." not in prefix:
+            yield prefix, value
+
+
 class AbstractFHIRClient(abc.ABC):
     """Abstract base class for FHIR client implementations."""
 
@@ -29,20 +84,47 @@ class AbstractFHIRClient(abc.ABC):
         """
         raise NotImplementedError
 
+    def stream_bundle(self, bundle_id: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Fetch a FHIR bundle as a stream of ("entry", entry) / (field, value) items.
+
+        The default implementation fetches the whole bundle via get_bundle and
+        replays it; HTTP clients override it to parse the response incrementally.
+
+        Raises:
+            FHIRClientError: If the request fails or bundle not found
+        """
+        for key, value in self.get_bundle(bundle_id).items():
+            if key == "entry":
+                for entry in value:
+                    yield "entry", entry
+            else:
+                yield key, value
+
 
 class HTTPFHIRClient(AbstractFHIRClient):
     """HTTP-based client to interact with FHIR Ingestion service API."""
 
-    def __init__(self, base_url: Optional[str] = None, timeout: int = 30):
+    def __init__(self, base_url: Optional[str] = None, timeout: int = 30, session: Optional[requests.Session] = None):
         """
         Initialize FHIR client.
 
         Args:
             base_url: Base URL for FHIR Ingestion API. If None, uses config.
             timeout: Request timeout in seconds
+            session: HTTP session to use. If None, uses the shared SESSION.
         """
         self.base_url = base_url or config.get_api_url()
         self.timeout = timeout
+        # Only a session handed in belongs to this client; the shared SESSION
+        # serves every other client in the process
+        self._owns_session = session is not None
+        self._session = session or SESSION
+
+    def close(self):
+        """Close this client's own session; a no-op for the shared SESSION."""
+        if self._owns_session:
+            self._session.close()
 
     def get_bundle(self, bundle_id: str) -> Dict[str, Any]:
         """
@@ -62,10 +144,10 @@ class HTTPFHIRClient(AbstractFHIRClient):
         logger.info(f"Fetching bundle {bundle_id} from {url}")
 
         try:
-            response = requests.get(url, timeout=self.timeout)
+            response = self._session.get(url, timeout=self.timeout)
             response.raise_for_status()
 
-            bundle_data = response.json()
+            bundle_data = orjson.loads(response.content)
             logger.info(f"Successfully fetched bundle {bundle_id}")
             return bundle_data
 
@@ -77,6 +159,10 @@ class HTTPFHIRClient(AbstractFHIRClient):
                 logger.error(f"HTTP error fetching bundle {bundle_id}: {e}")
                 raise FHIRClientError(f"Failed to fetch bundle: {e}") from e
 
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in bundle {bundle_id}: {e}")
+            raise FHIRClientError(f"Invalid bundle JSON: {e}") from e
+
         except requests.exceptions.RequestException as e:
             logger.error(f"Network error fetching bundle {bundle_id}: {e}")
             raise FHIRClientError(f"Network error: {e}") from e
@@ -85,6 +171,49 @@ class HTTPFHIRClient(AbstractFHIRClient):
             logger.error(f"Unexpected error fetching bundle {bundle_id}: {e}")
             raise FHIRClientError(f"Unexpected error: {e}") from e
 
+    def stream_bundle(self, bundle_id: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream a FHIR bundle from the ingestion service without decoding it as a whole.
+
+        The response body is parsed incrementally with ijson (see
+        iter_bundle_items), so peak memory is one entry rather than the full
+        JSON tree. Errors are mapped like in get_bundle.
+
+        Args:
+            bundle_id: The unique identifier for the bundle
+
+        Yields:
+            ("entry", entry) for each bundle entry, (field, value) for scalar top-level fields
+
+        Raises:
+            FHIRClientError: If the request fails, the bundle is not found or the JSON is invalid
+        """
+        url = f"{self.base_url}/api/v1/fhir/bundle/{bundle_id}"
+
+        logger.info(f"Streaming bundle {bundle_id} from {url}")
+
+        try:
+            with self._session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                yield from iter_bundle_items(response.raw)
+
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 404:
+                logger.error(f"Bundle {bundle_id} not found")
+                raise FHIRClientError(f"Bundle {bundle_id} not found") from e
+            else:
+                logger.error(f"HTTP error fetching bundle {bundle_id}: {e}")
+                raise FHIRClientError(f"Failed to fetch bundle: {e}") from e
+
+        except ijson.JSONError as e:
+            logger.error(f"Invalid JSON in bundle {bundle_id}: {e}")
+            raise FHIRClientError(f"Invalid bundle JSON: {e}") from e
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Network error fetching bundle {bundle_id}: {e}")
+            raise FHIRClientError(f"Network error: {e}") from e
+
 
 class FHIRClientError(Exception):
     """Exception raised for errors in the FHIR client."""
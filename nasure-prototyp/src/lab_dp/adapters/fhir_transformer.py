@@ -1,14 +1,37 @@
 """FHIR Bundle Transformer - Extract lab data from FHIR bundles."""
 
 import logging
+import sys
+import time
 import uuid
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+from datetime import datetime, timezone
 
+from lab_dp.adapters.fhir_client import FHIRClientError
 from lab_dp.domain.domain import LabDataProduct
 
 logger = logging.getLogger(__name__)
 
+# resourceType keys of the scanner table. Decoded resourceType values are
+# not interned: interning them measured slower than a plain dict lookup,
+# which is cheap because the string caches its hash (a hash match still
+# falls back to one == against the key).
+_PATIENT = sys.intern("Patient")
+_DIAGNOSTIC_REPORT = sys.intern("DiagnosticReport")
+_OBSERVATION = sys.intern("Observation")
+
+# Last formatted fallback timestamp, reused for all calls within the same second
+_NOW_ISO_CACHE = {"sec": -1, "iso": ""}
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as a naive ISO string (second resolution, cached per second)."""
+    sec = time.time_ns() // 1_000_000_000
+    if sec != _NOW_ISO_CACHE["sec"]:
+        _NOW_ISO_CACHE["iso"] = datetime.fromtimestamp(sec, tz=timezone.utc).replace(tzinfo=None).isoformat()
+        _NOW_ISO_CACHE["sec"] = sec
+    return _NOW_ISO_CACHE["iso"]
+
 
 class FHIRTransformer:
     """Transform FHIR bundles into LabDataProduct domain entities."""
@@ -29,17 +52,56 @@ class FHIRTransformer:
         Raises:
             FHIRTransformationError: If required data cannot be extracted
         """
+        return FHIRTransformer._transform(bundle.get("entry", ()), bundle, bundle_id, stored_at)
+
+    @staticmethod
+    def extract_from_stream(items: Iterable[Tuple[str, Any]], bundle_id: str, stored_at: datetime = None) -> LabDataProduct:
+        """
+        Extract lab surveillance data from a streamed FHIR bundle.
+
+        Same extraction as extract_lab_data_product, but over the
+        ("entry", entry) / (field, value) items of AbstractFHIRClient.stream_bundle,
+        so the bundle is never held in memory as a whole.
+
+        Args:
+            items: Streamed bundle items
+            bundle_id: The bundle identifier
+            stored_at: When the bundle was stored by fhir_ingestion (optional)
+
+        Returns:
+            LabDataProduct domain entity
+
+        Raises:
+            FHIRTransformationError: If required data cannot be extracted
+            FHIRClientError: If streaming the bundle fails
+        """
+        bundle_fields: Dict[str, Any] = {}
+        entries = FHIRTransformer._split_items(items, bundle_fields)
+        return FHIRTransformer._transform(entries, bundle_fields, bundle_id, stored_at)
+
+    @staticmethod
+    def _split_items(items: Iterable[Tuple[str, Any]], bundle_fields: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield the entries of streamed items, collecting the other fields into bundle_fields."""
+        for key, value in items:
+            if key == "entry":
+                yield value
+            else:
+                bundle_fields[key] = value
+
+    @staticmethod
+    def _transform(entries: Iterable[Dict[str, Any]], bundle: Dict[str, Any], bundle_id: str, stored_at: Optional[datetime]) -> LabDataProduct:
+        """Build the LabDataProduct from the bundle entries and top-level bundle fields."""
         try:
             logger.info(f"Transforming bundle {bundle_id}")
 
-            # Extract patient ID from bundle
-            patient_id = FHIRTransformer._extract_patient_id(bundle)
-
-            # Extract timestamp from bundle
-            timestamp = FHIRTransformer._extract_timestamp(bundle)
+            # One pass over the entries collects patient, timestamp and pathogen data.
+            # The scan consumes streamed entries completely before the top-level
+            # fields in `bundle` are read.
+            found = FHIRTransformer._scan_entries(entries)
 
-            # Extract pathogen information from Observation resources
-            pathogen_info = FHIRTransformer._extract_pathogen_info(bundle)
+            patient_id = FHIRTransformer._patient_id(found)
+            timestamp = FHIRTransformer._timestamp(found, bundle)
+            pathogen_info = FHIRTransformer._pathogen_info(found)
 
             # Generate product ID
             product_id = str(uuid.uuid4())
@@ -59,109 +121,124 @@ class FHIRTransformer:
             logger.info(f"Successfully transformed bundle {bundle_id} to product {product_id}")
             return product
 
+        except FHIRClientError:
+            # Fetch errors raised while streaming entries are not transformation errors
+            raise
+
         except Exception as e:
             logger.error(f"Failed to transform bundle {bundle_id}: {e}")
             raise FHIRTransformationError(f"Transformation failed: {e}") from e
 
     @staticmethod
-    def _extract_patient_id(bundle: Dict[str, Any]) -> str:
-        """Extract patient identifier from bundle."""
-        try:
-            # Look for Patient resource in bundle entries
-            entries = bundle.get("entry", [])
-            for entry in entries:
-                resource = entry.get("resource", {})
-                if resource.get("resourceType") == "Patient":
-                    # Get patient identifier
-                    identifiers = resource.get("identifier", [])
-                    if identifiers:
-                        return identifiers[0].get("value", "UNKNOWN")
-
-            # Fallback: look in DiagnosticReport subject
-            for entry in entries:
-                resource = entry.get("resource", {})
-                if resource.get("resourceType") == "DiagnosticReport":
-                    subject = resource.get("subject", {})
-                    reference = subject.get("reference", "")
-                    if "Patient/" in reference:
-                        return reference.split("Patient/")[1]
-
-            raise FHIRTransformationError("No patient identifier found in bundle")
+    def _scan_entries(entries) -> Dict[str, Any]:
+        """
+        Walk the bundle entries once, dispatching on resourceType.
 
-        except Exception as e:
-            raise FHIRTransformationError(f"Error extracting patient ID: {e}") from e
+        Each scanner only records the first match for its field(s), which keeps
+        the "first Patient / first DiagnosticReport / first Observation wins"
+        precedence of walking the entries once per field.
+        """
+        found: Dict[str, Any] = {}
+        for entry in entries:
+            resource = entry.get("resource") or {}
+            scan = _RESOURCE_SCANNERS.get(resource.get("resourceType"))
+            if scan is not None:
+                scan(resource, found)
+        return found
 
     @staticmethod
-    def _extract_timestamp(bundle: Dict[str, Any]) -> str:
-        """Extract effective timestamp from bundle."""
-        try:
-            # Look for DiagnosticReport effectiveDateTime
-            entries = bundle.get("entry", [])
-            for entry in entries:
-                resource = entry.get("resource", {})
-                if resource.get("resourceType") == "DiagnosticReport":
-                    effective_dt = resource.get("effectiveDateTime")
-                    if effective_dt:
-                        return effective_dt
-
-            # Fallback to bundle timestamp or current time
-            bundle_timestamp = bundle.get("timestamp")
-            if bundle_timestamp:
-                return bundle_timestamp
-
-            # Last resort: current timestamp
-            return datetime.utcnow().isoformat()
+    def _scan_patient(resource: Dict[str, Any], found: Dict[str, Any]):
+        """Record the identifier of the first Patient that has one."""
+        if "patient_id" not in found:
+            identifiers = resource.get("identifier", [])
+            if identifiers:
+                found["patient_id"] = identifiers[0].get("value", "UNKNOWN")
 
-        except Exception as e:
-            raise FHIRTransformationError(f"Error extracting timestamp: {e}") from e
+    @staticmethod
+    def _scan_diagnostic_report(resource: Dict[str, Any], found: Dict[str, Any]):
+        """Record the subject patient and effective timestamp of DiagnosticReports."""
+        if "subject_patient_id" not in found:
+            reference = resource.get("subject", {}).get("reference", "")
+            if "Patient/" in reference:
+                found["subject_patient_id"] = reference.split("Patient/")[1]
+        if "timestamp" not in found:
+            effective_dt = resource.get("effectiveDateTime")
+            if effective_dt:
+                found["timestamp"] = effective_dt
 
     @staticmethod
-    def _extract_pathogen_info(bundle: Dict[str, Any]) -> Dict[str, str]:
-        """Extract pathogen code, description, and interpretation from Observation resources."""
-        try:
-            entries = bundle.get("entry", [])
-
-            # Look for Observation resources with lab results
-            for entry in entries:
-                resource = entry.get("resource", {})
-                if resource.get("resourceType") == "Observation":
-                    # Get code (pathogen identification)
-                    code_obj = resource.get("code", {})
-                    coding = code_obj.get("coding", [])
-                    if coding:
-                        pathogen_code = coding[0].get("code", "UNKNOWN")
-                        pathogen_description = coding[0].get("display", "Unknown pathogen")
-                    else:
-                        pathogen_code = "UNKNOWN"
-                        pathogen_description = "Unknown pathogen"
-
-                    # Get interpretation (positive/negative/etc)
-                    interpretation_obj = resource.get("interpretation", [])
-                    if interpretation_obj:
-                        interp_coding = interpretation_obj[0].get("coding", [])
-                        if interp_coding:
-                            interpretation = interp_coding[0].get("code", "UNKNOWN")
-                        else:
-                            interpretation = "UNKNOWN"
-                    else:
-                        interpretation = "UNKNOWN"
-
-                    return {
-                        "code": pathogen_code,
-                        "description": pathogen_description,
-                        "interpretation": interpretation
-                    }
-
-            # If no observation found, return defaults
-            logger.warning("No Observation resource found in bundle, using defaults")
-            return {
-                "code": "UNKNOWN",
-                "description": "No pathogen data found",
-                "interpretation": "UNKNOWN"
-            }
+    def _scan_observation(resource: Dict[str, Any], found: Dict[str, Any]):
+        """Record pathogen code, description, and interpretation of the first Observation."""
+        if "pathogen" in found:
+            return
+
+        # Get code (pathogen identification)
+        coding = resource.get("code", {}).get("coding", [])
+        if coding:
+            pathogen_code = coding[0].get("code", "UNKNOWN")
+            pathogen_description = coding[0].get("display", "Unknown pathogen")
+        else:
+            pathogen_code = "UNKNOWN"
+            pathogen_description = "Unknown pathogen"
+
+        # Get interpretation (positive/negative/etc)
+        interpretation = "UNKNOWN"
+        interpretation_obj = resource.get("interpretation", [])
+        if interpretation_obj:
+            interp_coding = interpretation_obj[0].get("coding", [])
+            if interp_coding:
+                interpretation = interp_coding[0].get("code", "UNKNOWN")
+
+        found["pathogen"] = {
+            "code": pathogen_code,
+            "description": pathogen_description,
+            "interpretation": interpretation
+        }
 
-        except Exception as e:
-            raise FHIRTransformationError(f"Error extracting pathogen info: {e}") from e
+    @staticmethod
+    def _patient_id(found: Dict[str, Any]) -> str:
+        """Patient identifier, falling back to the DiagnosticReport subject."""
+        if "patient_id" in found:
+            return found["patient_id"]
+        if "subject_patient_id" in found:
+            return found["subject_patient_id"]
+        raise FHIRTransformationError("No patient identifier found in bundle")
+
+    @staticmethod
+    def _timestamp(found: Dict[str, Any], bundle: Dict[str, Any]) -> str:
+        """Effective timestamp, falling back to the bundle timestamp or now."""
+        if "timestamp" in found:
+            return found["timestamp"]
+
+        # Fallback to bundle timestamp or current time
+        bundle_timestamp = bundle.get("timestamp")
+        if bundle_timestamp:
+            return bundle_timestamp
+
+        # Last resort: current timestamp
+        return _utc_now_iso()
+
+    @staticmethod
+    def _pathogen_info(found: Dict[str, Any]) -> Dict[str, str]:
+        """Pathogen info of the first Observation, or defaults if there is none."""
+        if "pathogen" in found:
+            return found["pathogen"]
+
+        # If no observation found, return defaults
+        logger.warning("No Observation resource found in bundle, using defaults")
+        return {
+            "code": "UNKNOWN",
+            "description": "No pathogen data found",
+            "interpretation": "UNKNOWN"
+        }
+
+
+# resourceType -> scanner used by FHIRTransformer._scan_entries
+_RESOURCE_SCANNERS = {
+    _PATIENT: FHIRTransformer._scan_patient,
+    _DIAGNOSTIC_REPORT: FHIRTransformer._scan_diagnostic_report,
+    _OBSERVATION: FHIRTransformer._scan_observation,
+}
 
 
 class FHIRTransformationError(Exception):
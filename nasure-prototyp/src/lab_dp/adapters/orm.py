@@ -8,6 +8,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     event,
 )
 from sqlalchemy.orm import registry
@@ -46,7 +47,31 @@ metrics = Table(
     Column("created_at", DateTime),
 )
 
+# Indexes mirror migrations/*.sql so create_all() builds the same schema.
+# products are looked up by bundle_id (CreateDataProduct flow) and filtered by pathogen_code
+Index("idx_products_bundle_id", products.c.bundle_id)
+Index("idx_products_pathogen_code", products.c.pathogen_code)
+
+# The paginated list views filter on pathogen_code / (patient_id, pathogen_code)
+# and ORDER BY timestamp DESC LIMIT n; trailing timestamp lets Postgres read the
+# page straight off the index (scanned backwards) instead of sorting all matches.
+Index("idx_products_timestamp", products.c.timestamp)
+Index("idx_products_pathogen_timestamp", products.c.pathogen_code, products.c.timestamp)
+Index(
+    "idx_products_patient_pathogen_timestamp",
+    products.c.patient_id, products.c.pathogen_code, products.c.timestamp,
+)
+
+# metrics are filtered by pathogen (and time window) and located per product
+Index("idx_metrics_product_pathogen", metrics.c.product_id, metrics.c.pathogen_code)
+Index("idx_metrics_pathogen_created_at", metrics.c.pathogen_code, metrics.c.created_at)
+Index("idx_metrics_created_at", metrics.c.created_at)
+
 def start_mappers():
+    # lab_api maps at import and the consumer on startup; mapping a class
+    # twice raises, so only map when this registry is still empty
+    if mapper_registry.mappers:
+        return
     logger.info("Starting mappers")
     mapper_registry.map_imperatively(domain.LabDataProduct, products)
 
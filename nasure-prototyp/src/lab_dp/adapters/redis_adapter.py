@@ -1,33 +1,78 @@
 """Redis adapter for publishing events following Cosmic Python pattern."""
 
-import json
+import atexit
 import logging
-from dataclasses import asdict
-from datetime import datetime
+import queue
+import threading
+from typing import Optional, Tuple
+import orjson
 import redis
 
-from config import get_redis_host_and_port
+from config import get_redis_pool
 from shared.domain.commands import Event
 
 logger = logging.getLogger(__name__)
 
-r = redis.Redis(**get_redis_host_and_port())
+r = redis.Redis(connection_pool=get_redis_pool())
 
+# Events are published from a background thread so command handling never
+# waits on a Redis round trip; queued events go out in pipelined batches.
+PUBLISH_BATCH_SIZE = 128
 
-def _serialize_event(event: Event) -> str:
-    """Serialize event to JSON, handling datetime objects."""
-    event_dict = asdict(event)
+_publish_queue: "queue.Queue[Tuple[str, bytes]]" = queue.Queue()
+_publisher: Optional[threading.Thread] = None
+_publisher_lock = threading.Lock()
 
-    # Convert datetime objects to ISO strings
-    for key, value in event_dict.items():
-        if isinstance(value, datetime):
-            event_dict[key] = value.isoformat()
 
-    return json.dumps(event_dict)
+def _serialize_event(event: Event) -> bytes:
+    """Serialize event to JSON; orjson encodes dataclasses and datetimes (ISO 8601) natively."""
+    return orjson.dumps(event)
+
+
+def _publish_batches():
+    """Drain the publish queue, sending up to PUBLISH_BATCH_SIZE events per pipeline."""
+    while True:
+        batch = [_publish_queue.get()]
+        while len(batch) < PUBLISH_BATCH_SIZE:
+            try:
+                batch.append(_publish_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            pipe = r.pipeline(transaction=False)
+            for channel, message in batch:
+                pipe.publish(channel, message)
+            pipe.execute()
+        except Exception:
+            logger.exception("Failed to publish %d queued events", len(batch))
+        finally:
+            for _ in batch:
+                _publish_queue.task_done()
+
+
+def _ensure_publisher():
+    global _publisher
+    if _publisher is None:
+        with _publisher_lock:
+            if _publisher is None:
+                _publisher = threading.Thread(
+                    target=_publish_batches, name="redis-publisher", daemon=True
+                )
+                _publisher.start()
 
 
 def publish(channel: str, event: Event):
-    """Publish event to Redis channel."""
+    """Queue event for publishing to a Redis channel; returns without waiting for Redis."""
     logger.info("publishing: channel=%s, event=%s", channel, event)
-    message = _serialize_event(event)
-    r.publish(channel, message)
+    _ensure_publisher()
+    _publish_queue.put_nowait((channel, _serialize_event(event)))
+
+
+def flush():
+    """Block until every queued event has been handed to Redis."""
+    if _publisher is not None:
+        _publish_queue.join()
+
+
+atexit.register(flush)
@@ -1,30 +1,34 @@
 import abc
-from typing import Set, List
+from typing import Dict, Iterator
 from sqlalchemy import select
 from lab_dp.adapters import orm
 from lab_dp.domain import domain
 
+# Rows fetched per round trip when streaming the products table
+LIST_BATCH_SIZE = 500
+
 
 class AbstractRepository(abc.ABC):
     def __init__(self):
-        self.seen = set()  # type: Set[domain.LabDataProduct]
+        # Keyed by product_id, so tracking doesn't hash every dataclass field
+        self.seen = {}  # type: Dict[str, domain.LabDataProduct]
 
     def add(self, product: domain.LabDataProduct) -> str:
         self._add(product)
-        self.seen.add(product)
+        self.seen[product.product_id] = product
         return product.product_id
 
     def get(self, product_id) -> domain.LabDataProduct:
         product = self._get(product_id)
         if product:
-            self.seen.add(product)
+            self.seen[product.product_id] = product
         return product
 
-    def list(self) -> List[domain.LabDataProduct]:
-        products = self._list()
-        for product in products:
-            self.seen.add(product)
-        return products
+    def list(self) -> Iterator[domain.LabDataProduct]:
+        # Lazy: products are registered in seen as the caller consumes them
+        for product in self._list():
+            self.seen[product.product_id] = product
+            yield product
 
     @abc.abstractmethod
     def _add(self, product: domain.LabDataProduct):
@@ -35,7 +39,7 @@ class AbstractRepository(abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def _list(self) -> List[domain.LabDataProduct]:
+    def _list(self) -> Iterator[domain.LabDataProduct]:
         raise NotImplementedError
 
 class SqlAlchemyRepository(AbstractRepository):
@@ -47,8 +51,11 @@ class SqlAlchemyRepository(AbstractRepository):
         self.session.add(product)
 
     def _get(self, product_id):
-        return self.session.query(domain.LabDataProduct).filter_by(product_id=product_id).first()
+        # Primary-key lookup: served from the identity map when already loaded
+        return self.session.get(domain.LabDataProduct, product_id)
 
-    def _list(self) -> List[domain.LabDataProduct]:
-        return self.session.query(domain.LabDataProduct).all()
+    def _list(self) -> Iterator[domain.LabDataProduct]:
+        # Stream in batches instead of buffering the whole table
+        stmt = select(domain.LabDataProduct).execution_options(yield_per=LIST_BATCH_SIZE)
+        return iter(self.session.scalars(stmt))
 
@@ -6,7 +6,7 @@ from datetime import datetime
 from shared.domain.commands import Command
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateDataProduct(Command):
     """Command to generate surveillance data product from stored FHIR bundle."""
     bundle_id: str
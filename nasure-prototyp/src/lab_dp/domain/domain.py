@@ -5,7 +5,9 @@ from datetime import datetime, timezone
 from lab_dp.domain.events import DataProductCreated
 
 
-@dataclass(unsafe_hash=True)
+# Entity: identity and hash are the object's own; seen tracking is keyed by
+# product_id, so no value equality is needed
+@dataclass(eq=False)
 class LabDataProduct:
     product_id: str
     patient_id: str
@@ -16,7 +18,7 @@ class LabDataProduct:
     interpretation: str
     stored_at: datetime = None  # When bundle was stored by fhir_ingestion
     version_number: int = 0
-    events: List = field(default_factory=list, compare=False, hash=False)
+    events: List = field(default_factory=list)
 
     def create(self) -> None:
         """
@@ -6,7 +6,7 @@ from datetime import datetime
 from shared.domain.commands import Event
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DataProductCreated(Event):
     """Event raised when a lab data product has been successfully created."""
     product_id: str
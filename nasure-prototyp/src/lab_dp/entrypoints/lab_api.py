@@ -4,11 +4,11 @@ Following Cosmic Python pattern: thin API layer delegates to views.
 """
 
 from datetime import datetime, timezone
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 import logging
 
 from lab_dp import views
-from lab_dp.service_layer.unit_of_work import SqlAlchemyUnitOfWork
+from lab_dp.service_layer.unit_of_work import READ_SESSION_FACTORY, SqlAlchemyUnitOfWork
 from lab_dp.adapters import orm
 
 # Configure logging
@@ -26,6 +26,16 @@ app = FastAPI(
 )
 
 
+def get_read_uow() -> SqlAlchemyUnitOfWork:
+    """
+    Unit of work for read-only endpoints.
+
+    Sessions come from READ_SESSION_FACTORY on the shared engine pool;
+    the views' `with uow:` block closes them again.
+    """
+    return SqlAlchemyUnitOfWork(session_factory=READ_SESSION_FACTORY)
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -37,7 +47,7 @@ async def health_check():
 
 
 @app.get("/api/v1/data-products")
-def get_data_products(limit: int = 100, offset: int = 0):
+def get_data_products(limit: int = 100, offset: int = 0, uow: SqlAlchemyUnitOfWork = Depends(get_read_uow)):
     """
     Retrieve all lab data products with pagination.
 
@@ -50,22 +60,19 @@ def get_data_products(limit: int = 100, offset: int = 0):
     Returns:
         List of data products with pagination info
     """
-    uow = SqlAlchemyUnitOfWork()
     result = views.get_all_data_products(uow, limit, offset)
 
     return result
 
 
 @app.get("/api/v1/data-product/{product_id}")
-def get_data_product(product_id: str):
+def get_data_product(product_id: str, uow: SqlAlchemyUnitOfWork = Depends(get_read_uow)):
     """
     Retrieve lab data product by product_id.
 
     Following Cosmic Python pattern: API layer is thin, delegates to repository.
     Serializes object to dict inside session context to avoid DetachedInstanceError.
     """
-    uow = SqlAlchemyUnitOfWork()
-
     with uow:
         product = uow.products.get(product_id)
 
@@ -91,7 +98,7 @@ def get_data_product(product_id: str):
 
 
 @app.get("/api/v1/metrics/quality")
-def get_quality_metrics():
+def get_quality_metrics(uow: SqlAlchemyUnitOfWork = Depends(get_read_uow)):
     """
     Get overall quality metrics.
 
@@ -101,14 +108,13 @@ def get_quality_metrics():
         - last_updated: When the most recent report was created
         - average_delay_hours: Average processing delay
     """
-    uow = SqlAlchemyUnitOfWork()
     metrics = views.get_quality_metrics(uow)
 
     return metrics
 
 
 @app.get("/api/v1/metrics/pathogen/{pathogen_code}")
-def get_pathogen_count(pathogen_code: str):
+def get_pathogen_count(pathogen_code: str, uow: SqlAlchemyUnitOfWork = Depends(get_read_uow)):
     """
     Get count of reports for a pathogen in last 24 hours.
 
@@ -120,14 +126,18 @@ def get_pathogen_count(pathogen_code: str):
     Returns:
         Count of reports in last 24 hours for the specified pathogen
     """
-    uow = SqlAlchemyUnitOfWork()
     metrics = views.get_pathogen_count_last_24h(pathogen_code, uow)
 
     return metrics
 
 
 @app.get("/api/v1/data-products/pathogen/{pathogen_code}")
-def get_data_products_by_pathogen(pathogen_code: str, limit: int = 100, offset: int = 0):
+def get_data_products_by_pathogen(
+    pathogen_code: str,
+    limit: int = 100,
+    offset: int = 0,
+    uow: SqlAlchemyUnitOfWork = Depends(get_read_uow)
+):
     """
     Get all data products for a specific pathogen.
 
@@ -141,7 +151,6 @@ def get_data_products_by_pathogen(pathogen_code: str, limit: int = 100, offset:
     Returns:
         List of data products filtered by pathogen code
     """
-    uow = SqlAlchemyUnitOfWork()
     result = views.get_data_products_by_pathogen(pathogen_code, uow, limit, offset)
 
     return result
@@ -152,7 +161,8 @@ def get_data_products_by_patient_and_pathogen(
     patient_id: str,
     pathogen_code: str,
     limit: int = 100,
-    offset: int = 0
+    offset: int = 0,
+    uow: SqlAlchemyUnitOfWork = Depends(get_read_uow)
 ):
     """
     Get all data products for a specific patient and pathogen.
@@ -168,7 +178,6 @@ def get_data_products_by_patient_and_pathogen(
     Returns:
         List of data products filtered by patient and pathogen
     """
-    uow = SqlAlchemyUnitOfWork()
     result = views.get_data_products_by_patient_and_pathogen(
         patient_id, pathogen_code, uow, limit, offset
     )
@@ -1,7 +1,10 @@
 """Redis event consumer for lab_dp service - listens to BundleStored events."""
 
-import json
 import logging
+import time
+from datetime import datetime
+from typing import List, Optional
+import orjson
 import redis
 from sqlalchemy import create_engine
 
@@ -15,7 +18,16 @@ from lab_dp.adapters import orm
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-r = redis.Redis(**config.get_redis_host_and_port())
+r = redis.Redis(connection_pool=config.get_redis_pool())
+
+# Messages are drained from the pubsub socket and handled in batches:
+# a batch is flushed when it is full, when it has waited BATCH_TIMEOUT_SECONDS,
+# or when the channel goes idle.
+BATCH_SIZE = 100
+BATCH_TIMEOUT_SECONDS = 0.05
+
+# Swiss CH-eLM bundle type codes processed into data products (Laborbericht)
+LABORBERICHT_CODES = frozenset(("4241000179101",))
 
 
 def main():
@@ -34,8 +46,44 @@ def main():
 
     logger.info("Subscribed to 'surveillance:bundles' channel, waiting for messages...")
 
-    for m in pubsub.listen():
-        handle_bundle_stored(m)
+    batch = []
+    deadline = 0.0
+    while True:
+        m = pubsub.get_message(timeout=BATCH_TIMEOUT_SECONDS)
+        if m is not None:
+            if not batch:
+                deadline = time.monotonic() + BATCH_TIMEOUT_SECONDS
+            batch.append(m)
+        if batch and (m is None or len(batch) >= BATCH_SIZE or time.monotonic() >= deadline):
+            handle_bundle_stored_batch(batch)
+            batch = []
+
+
+def handle_bundle_stored_batch(messages: List[dict]):
+    """
+    Handle a batch of BundleStored events from Redis.
+
+    All payloads are parsed and filtered first, then the resulting commands
+    are dispatched through one unit of work. Each command still commits on
+    its own, so a bundle that cannot be fetched or transformed does not roll
+    back the rest of the batch.
+
+    Errors are logged and the batch is dropped, so the consumer keeps listening.
+
+    Args:
+        messages: Redis message dictionaries
+    """
+    cmds = [cmd for cmd in map(parse_bundle_stored, messages) if cmd is not None]
+    if not cmds:
+        return
+
+    try:
+        uow = SqlAlchemyUnitOfWork()
+        results = messagebus.handle_many(cmds, uow)
+        logger.info("Processed batch of %d bundles, results: %s", len(cmds), results)
+
+    except Exception as e:
+        logger.error("Error handling batch of %d bundles: %s", len(cmds), e, exc_info=True)
 
 
 def handle_bundle_stored(m):
@@ -50,44 +98,66 @@ def handle_bundle_stored(m):
     Args:
         m: Redis message dictionary
     """
+    cmd = parse_bundle_stored(m)
+    if cmd is None:
+        return
+
+    try:
+        # Create unit of work and handle command
+        uow = SqlAlchemyUnitOfWork()
+        result = messagebus.handle(cmd, uow)
+
+        logger.info(f"Successfully processed bundle {cmd.bundle_id}, result: {result}")
+
+    except Exception as e:
+        logger.error(f"Error handling bundle stored event: {e}", exc_info=True)
+
+
+def parse_bundle_stored(m) -> Optional[commands.CreateDataProduct]:
+    """
+    Build a CreateDataProduct command from a BundleStored message.
+
+    Only Laborbericht bundles (bundle_type '4241000179101') yield a command.
+
+    Args:
+        m: Redis message dictionary
+
+    Returns:
+        The command, or None if the message is invalid or not a Laborbericht
+        (the reason is logged)
+    """
     logger.info("Received message: %s", m)
 
     try:
-        # Parse message data
-        data = json.loads(m["data"])
+        # orjson parses the raw bytes payload without a separate decode step
+        data = orjson.loads(m["data"])
         bundle_id = data.get("bundle_id")
         bundle_type = data.get("bundle_type")
         stored_at_str = data.get("stored_at")
 
         if not bundle_id:
             logger.error("No bundle_id in message: %s", data)
-            return
+            return None
 
         # Filter: Only process Laborbericht (4241000179101)
         logger.info(f"Checking if bundle {bundle_id} is a Laborbericht, bundle_type={bundle_type}")
         if not is_laborbericht(bundle_type):
             logger.info(f"Skipping bundle {bundle_id} - not a Laborbericht (bundle_type={bundle_type})")
-            return
+            return None
 
         logger.info(f"Processing BundleStored event for Laborbericht bundle {bundle_id}")
 
         # Parse stored_at timestamp from BundleStored event
-        from datetime import datetime
-        stored_at = datetime.fromisoformat(stored_at_str.replace('Z', '+00:00')) if stored_at_str else datetime.utcnow()
+        stored_at = datetime.fromisoformat(stored_at_str) if stored_at_str else datetime.utcnow()
 
         # Create command to process the bundle
-        cmd = commands.CreateDataProduct(bundle_id=bundle_id, stored_at=stored_at)
-
-        # Create unit of work and handle command
-        uow = SqlAlchemyUnitOfWork()
-        results = messagebus.handle(cmd, uow)
-
-        logger.info(f"Successfully processed bundle {bundle_id}, results: {results}")
+        return commands.CreateDataProduct(bundle_id=bundle_id, stored_at=stored_at)
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON from message: {e}")
     except Exception as e:
-        logger.error(f"Error handling bundle stored event: {e}", exc_info=True)
+        logger.error(f"Error parsing bundle stored event: {e}", exc_info=True)
+    return None
 
 
 def is_laborbericht(bundle_type):
@@ -101,20 +171,15 @@ def is_laborbericht(bundle_type):
     Returns:
         bool: True if bundle_type code is 4241000179101 (CH-eLM Laborbericht)
     """
-    LABORBERICHT_CODE = "4241000179101"  # Swiss CH-eLM code for Laborbericht
-
     if not bundle_type:
-        logger.debug("bundle_type is None or empty")
         return False
 
-    # Handle both tuple (from Python) and list (from JSON deserialization)
-    if isinstance(bundle_type, (tuple, list)) and len(bundle_type) >= 1:
-        result = bundle_type[0] == LABORBERICHT_CODE
-        logger.debug(f"bundle_type check: {bundle_type[0]} == {LABORBERICHT_CODE} -> {result}")
-        return result
-
-    logger.debug(f"bundle_type has unexpected format: {type(bundle_type)}, value: {bundle_type}")
-    return False
+    # Tuple (from Python) and list (from JSON deserialization) both index the same
+    try:
+        return bundle_type[0] in LABORBERICHT_CODES
+    except (TypeError, IndexError, KeyError):
+        logger.debug("bundle_type has unexpected format: %s, value: %s", type(bundle_type), bundle_type)
+        return False
 
 
 if __name__ == "__main__":
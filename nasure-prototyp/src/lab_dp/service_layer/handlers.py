@@ -17,8 +17,8 @@ def create_data_product(
     Create lab data product from stored FHIR bundle.
 
     Flow:
-    1. Fetch FHIR bundle from fhir_ingestion service via API
-    2. Transform bundle to LabDataProduct domain entity
+    1. Stream FHIR bundle from fhir_ingestion service via API
+    2. Transform bundle entries to LabDataProduct domain entity
     3. Store product in database via repository
     4. Commit transaction
 
@@ -38,14 +38,11 @@ def create_data_product(
     try:
         # Initialize UoW to get access to fhir_client (but outside transaction)
         with uow:
-            # Step 1: Fetch FHIR bundle from ingestion service
-            bundle_data = uow.fhir_client.get_bundle(command.bundle_id)
-            logger.info(f"Fetched bundle {command.bundle_id} from FHIR ingestion service")
-
-            # Step 2: Transform FHIR bundle to domain entity
+            # Step 1+2: Stream FHIR bundle from ingestion service and transform it
+            # to a domain entity on the fly (the bundle is never fully decoded)
             transformer = FHIRTransformer()
-            lab_product = transformer.extract_lab_data_product(
-                bundle_data,
+            lab_product = transformer.extract_from_stream(
+                uow.fhir_client.stream_bundle(command.bundle_id),
                 command.bundle_id,
                 stored_at=command.stored_at
             )
@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 import logging
-from typing import List, Dict, Callable, Type, Union, TYPE_CHECKING
+from collections import deque
+from types import MappingProxyType
+from typing import Deque, List, Callable, Mapping, Tuple, Type, Union, TYPE_CHECKING
 
 from shared.domain.commands import Command, Event
 from lab_dp.domain.commands import CreateDataProduct
@@ -22,31 +24,57 @@ def handle(
     message: Message,
     uow: AbstractUnitOfWork,
 ):
-    """Handle message (command or event) with the appropriate handler."""
-    results = []
-    queue = [message]
+    """
+    Handle message (command or event) with the appropriate handler.
+
+    Returns the command handler's result, or None if message is an event.
+    Only the initial message can be a command - the queue only grows with
+    events - so there is at most one result.
+    """
+    command_result = None
+    queue = deque([message])
 
     while queue:
-        message = queue.pop(0)
+        message = queue.popleft()
+
+        # Exact-type lookup replaces the isinstance(Event)/isinstance(Command) chain
+        dispatch = DISPATCH.get(type(message))
+        if dispatch is None:
+            raise Exception(f"{message} was not a registered Event or Command")
+        handle_message, is_command = dispatch
+        result = handle_message(message, queue, uow)
+        if is_command:
+            command_result = result
 
-        if isinstance(message, Event):
-            handle_event(message, queue, uow)
-        elif isinstance(message, Command):
-            cmd_result = handle_command(message, queue, uow)
-            results.append(cmd_result)
-        else:
-            raise Exception(f"{message} was not an Event or Command")
+    return command_result
+
+
+def handle_many(
+    messages: List[Message],
+    uow: AbstractUnitOfWork,
+):
+    """
+    Handle a batch of messages with one unit of work.
 
+    A failing message is logged by handle_command and skipped so the rest of
+    the batch is still processed.
+    """
+    results = []
+    for message in messages:
+        try:
+            results.append(handle(message, uow))
+        except Exception:
+            continue
     return results
 
 
 def handle_event(
     event: Event,
-    queue: List[Message],
+    queue: Deque[Message],
     uow: AbstractUnitOfWork,
 ):
     """Handle event by calling all registered event handlers."""
-    for handler in EVENT_HANDLERS[type(event)]:
+    for handler in EVENT_HANDLERS.get(type(event), ()):
         try:
             logger.debug(f"handling event {event} with handler {handler}")
             handler(event, uow=uow)
@@ -58,7 +86,7 @@ def handle_event(
 
 def handle_command(
     command: Command,
-    queue: List[Message],
+    queue: Deque[Message],
     uow: AbstractUnitOfWork,
 ):
     """Handle command by calling the registered command handler."""
@@ -74,14 +102,20 @@ def handle_command(
 
 
 # Event handlers - multiple handlers can respond to same event
-EVENT_HANDLERS = {
-    DataProductCreated: [
+EVENT_HANDLERS = MappingProxyType({
+    DataProductCreated: (
         handlers.update_metrics_read_model,
         handlers.publish_data_product_event,
-    ],
-}  # type: Dict[Type[Event], List[Callable]]
+    ),
+})  # type: Mapping[Type[Event], Tuple[Callable, ...]]
 
 # Command handlers - single handler per command type
-COMMAND_HANDLERS = {
+COMMAND_HANDLERS = MappingProxyType({
     CreateDataProduct: handlers.create_data_product,
-}  # type: Dict[Type[Command], Callable]
+})  # type: Mapping[Type[Command], Callable]
+
+# Dispatch table built once at import: message type -> (handle_* function, is_command)
+DISPATCH = MappingProxyType({
+    **{event_type: (handle_event, False) for event_type in EVENT_HANDLERS},
+    **{command_type: (handle_command, True) for command_type in COMMAND_HANDLERS},
+})  # type: Mapping[type, Tuple[Callable, bool]]
@@ -24,9 +24,11 @@ class AbstractUnitOfWork(abc.ABC):
         self._commit()
 
     def collect_new_events(self):
-        for product in self.products.seen:
-            while product.events:
-                yield product.events.pop(0)
+        for product in self.products.seen.values():
+            if product.events:
+                events = product.events[:]
+                product.events.clear()
+                yield from events
 
     @abc.abstractmethod
     def _commit(self):
@@ -37,13 +39,23 @@ class AbstractUnitOfWork(abc.ABC):
         raise NotImplementedError
 
 
-DEFAULT_SESSION_FACTORY = sessionmaker(
-    bind=create_engine(
-        config.get_postgres_uri(),
-        isolation_level="REPEATABLE READ",
-    )
+# One pooled engine per process, shared by the write path and the read API.
+# The pool is sized for the API's worker threads; connections are recycled
+# before server-side idle timeouts hit.
+ENGINE = create_engine(
+    config.get_postgres_uri(),
+    isolation_level="REPEATABLE READ",
+    pool_size=10,
+    max_overflow=20,
+    pool_recycle=1800,
 )
 
+DEFAULT_SESSION_FACTORY = sessionmaker(bind=ENGINE)
+
+# Sessions for read-only views: nothing is ever flushed, and loaded objects
+# stay readable after commit instead of being expired and reloaded.
+READ_SESSION_FACTORY = sessionmaker(bind=ENGINE, autoflush=False, expire_on_commit=False)
+
 class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
     def __init__(self, session_factory=DEFAULT_SESSION_FACTORY, fhir_client_impl=None):
         self.session_factory = session_factory
@@ -15,6 +15,20 @@ from lab_dp.service_layer.unit_of_work import AbstractUnitOfWork
 logger = logging.getLogger(__name__)
 
 
+def _total_count(session, count_sql: str, params: Dict[str, Any], limit: int, offset: int, page_size: int) -> int:
+    """
+    Total number of rows matching a paginated query.
+
+    A page shorter than `limit` is the last one, so the total follows from
+    offset + page_size without a COUNT(*) over all matching rows. An empty
+    page past offset 0 proves nothing (the offset may overshoot the end) and
+    still runs the count, as does a full page.
+    """
+    if page_size < limit and (page_size or offset == 0):
+        return offset + page_size
+    return session.execute(text(count_sql), params).scalar() or 0
+
+
 def get_quality_metrics(uow: AbstractUnitOfWork) -> Dict[str, Any]:
     """
     Get overall quality metrics with two types of latency and report count:
@@ -65,8 +79,10 @@ def get_quality_metrics(uow: AbstractUnitOfWork) -> Dict[str, Any]:
             """)
         ).scalar()
 
-        # Count new reports in last 24 hours
-        since = datetime.utcnow() - timedelta(hours=24)
+        # Count new reports in last 24 hours; one clock read serves the
+        # window and queried_at
+        now = datetime.utcnow()
+        since = now - timedelta(hours=24)
         reports_count = session.execute(
             text("""
                 SELECT COUNT(*)
@@ -81,7 +97,7 @@ def get_quality_metrics(uow: AbstractUnitOfWork) -> Dict[str, Any]:
             "avg_reporting_latency_hours": round(float(avg_reporting_latency), 2) if avg_reporting_latency else None,
             "avg_processing_latency_seconds": round(float(avg_processing_latency), 2) if avg_processing_latency else None,
             "reports_last_24h": int(reports_count) if reports_count else 0,
-            "queried_at": datetime.utcnow().isoformat(),
+            "queried_at": now.isoformat(),
         }
 
 
@@ -106,11 +122,6 @@ def get_all_data_products(
     with uow:
         session = uow.session
 
-        # Get total count
-        total = session.execute(
-            text("SELECT COUNT(*) FROM products")
-        ).scalar()
-
         # Get paginated results
         results = session.execute(
             text("""
@@ -126,6 +137,14 @@ def get_all_data_products(
         # Serialize to dicts inside session context (Cosmic Python pattern)
         products = [dict(row._mapping) for row in results]
 
+        # Get total count
+        total = _total_count(
+            session,
+            "SELECT COUNT(*) FROM products",
+            {},
+            limit, offset, len(products)
+        )
+
     return {
         "total": total or 0,
         "limit": limit,
@@ -151,7 +170,8 @@ def get_pathogen_count_last_24h(
     """
     with uow:
         session = uow.session
-        since = datetime.utcnow() - timedelta(hours=24)
+        now = datetime.utcnow()
+        since = now - timedelta(hours=24)
 
         count = session.execute(
             text("""
@@ -167,7 +187,7 @@ def get_pathogen_count_last_24h(
             "pathogen_code": pathogen_code,
             "count": count or 0,
             "time_window_hours": 24,
-            "queried_at": datetime.utcnow().isoformat(),
+            "queried_at": now.isoformat(),
         }
 
 
@@ -194,16 +214,6 @@ def get_data_products_by_pathogen(
     with uow:
         session = uow.session
 
-        # Get total count
-        total = session.execute(
-            text("""
-                SELECT COUNT(*)
-                FROM products
-                WHERE pathogen_code = :pathogen_code
-            """),
-            dict(pathogen_code=pathogen_code)
-        ).scalar()
-
         # Get paginated results
         results = session.execute(
             text("""
@@ -220,6 +230,18 @@ def get_data_products_by_pathogen(
         # Serialize to dicts inside session context (Cosmic Python pattern)
         products = [dict(row._mapping) for row in results]
 
+        # Get total count
+        total = _total_count(
+            session,
+            """
+                SELECT COUNT(*)
+                FROM products
+                WHERE pathogen_code = :pathogen_code
+            """,
+            dict(pathogen_code=pathogen_code),
+            limit, offset, len(products)
+        )
+
     return {
         "pathogen_code": pathogen_code,
         "total": total or 0,
@@ -255,17 +277,6 @@ def get_data_products_by_patient_and_pathogen(
     with uow:
         session = uow.session
 
-        # Get total count
-        total = session.execute(
-            text("""
-                SELECT COUNT(*)
-                FROM products
-                WHERE patient_id = :patient_id
-                  AND pathogen_code = :pathogen_code
-            """),
-            dict(patient_id=patient_id, pathogen_code=pathogen_code)
-        ).scalar()
-
         # Get paginated results
         results = session.execute(
             text("""
@@ -283,6 +294,19 @@ def get_data_products_by_patient_and_pathogen(
         # Serialize to dicts inside session context (Cosmic Python pattern)
         products = [dict(row._mapping) for row in results]
 
+        # Get total count
+        total = _total_count(
+            session,
+            """
+                SELECT COUNT(*)
+                FROM products
+                WHERE patient_id = :patient_id
+                  AND pathogen_code = :pathogen_code
+            """,
+            dict(patient_id=patient_id, pathogen_code=pathogen_code),
+            limit, offset, len(products)
+        )
+
     return {
         "patient_id": patient_id,
         "pathogen_code": pathogen_code,
@@ -19,6 +19,8 @@ setup(
         "redis",
         "minio",
         "requests",
+        "orjson",
+        "ijson",
         "python-multipart",
         "python-jose[cryptography]",
         "passlib[bcrypt]",
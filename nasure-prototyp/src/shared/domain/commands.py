@@ -3,17 +3,17 @@
 from dataclasses import dataclass
 
 
-@dataclass
 class Command:
     """Base class for all commands."""
-    pass
+    # Empty slots keep slotted subclasses free of a per-instance __dict__;
+    # a plain (non-dataclass) base lets subclasses choose frozen or not.
+    __slots__ = ()
 
-@dataclass
 class Event:
     """Base class for all domain events."""
-    pass
+    __slots__ = ()
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PseudonymizePatient(Command):
     """ Command to pseudonymize a patient based on provided data."""
     ahv_number: str
@@ -23,12 +23,12 @@ class PseudonymizePatient(Command):
     birthdate: str  # 'YYYY-MM-DD'
     canton: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetPatientByAHV(Command):
     """ Command to get patient_id by AHV number."""
     ahv_number: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetPatientDetails(Command):
     """ Command to get patient details by patient_id."""
     patient_id: str
@@ -0,0 +1,104 @@
+"""Unit tests for case matching in the case classifier."""
+
+import pandas as pd
+import pytest
+
+from case.classifier import CaseStore, IncomingElement, upsert_case_and_link_id, upsert_cases_bulk
+
+
+def empty_frames():
+    falldatenprodukt = pd.DataFrame(columns=["case_ID", "Patient_ID", "Pathogen_code", "Date"])
+    fall_meldung_tabelle = pd.DataFrame(columns=["ID", "case_ID"])
+    return falldatenprodukt, fall_meldung_tabelle
+
+
+def incoming(meldung_id, date, patient_id="P1", pathogen="A1"):
+    return IncomingElement(Patient_ID=patient_id, Pathogen_code=pathogen, Date=pd.Timestamp(date), ID=meldung_id)
+
+
+def grouping(case_ids):
+    """Case IDs relabelled by first appearance, so random UUIDs compare equal."""
+    labels = {}
+    return [labels.setdefault(case_id, len(labels)) for case_id in case_ids]
+
+
+def sequential(incomings):
+    falldatenprodukt, fall_meldung_tabelle = empty_frames()
+    return [upsert_case_and_link_id(i, falldatenprodukt, fall_meldung_tabelle) for i in incomings]
+
+
+def streaming(incomings):
+    store = CaseStore.from_frames(*empty_frames())
+    return [store.upsert(i) for i in incomings]
+
+
+def bulk(incomings):
+    falldatenprodukt, fall_meldung_tabelle = empty_frames()
+    case_ids, _, _ = upsert_cases_bulk(incomings, falldatenprodukt, fall_meldung_tabelle)
+    return case_ids
+
+
+# 28 days and 1 hour apart: 28 whole days, so within the default window
+A = incoming("M-A", "2024-01-01 12:00")
+B = incoming("M-B", "2024-01-29 13:00")
+
+
+@pytest.mark.parametrize("incomings", [[A, B], [B, A]])
+def test_bulk_matches_sequential_for_either_order(incomings):
+    assert grouping(bulk(incomings)) == grouping(sequential(incomings)) == [0, 0]
+
+
+@pytest.mark.parametrize("incomings", [
+    [incoming("M-1", "2024-01-01"), incoming("M-2", "2024-03-01"), incoming("M-3", "2024-01-20")],
+    [incoming("M-1", "2024-03-01"), incoming("M-2", "2024-01-20"), incoming("M-3", "2024-01-01")],
+    [incoming("M-1", "2024-01-01"), incoming("M-2", "2024-01-01", patient_id="P2"),
+     incoming("M-3", "2024-01-10", pathogen="B2"), incoming("M-4", "2024-01-15")],
+])
+def test_bulk_matches_sequential(incomings):
+    assert grouping(bulk(incomings)) == grouping(sequential(incomings))
+
+
+# Calendar days differ (29), whole 24h periods do not (28d 2h -> 28)
+LATE = incoming("M-late", "2024-01-01 23:00")
+EARLY = incoming("M-early", "2024-01-30 01:00")
+
+
+@pytest.mark.parametrize("path", [sequential, streaming, bulk])
+def test_window_counts_whole_24h_periods(path):
+    assert grouping(path([LATE, EARLY])) == [0, 0]
+
+
+@pytest.mark.parametrize("path", [sequential, streaming, bulk])
+def test_missing_date_opens_new_case(path):
+    case_ids = path([A, incoming("M-nat", pd.NaT)])
+    assert grouping(case_ids) == [0, 1]
+
+
+def test_streaming_matches_sequential():
+    incomings = [
+        incoming("M-1", "2024-01-01 12:00"), incoming("M-2", "2024-03-01"),
+        incoming("M-3", "2024-01-29 13:00"), incoming("M-4", "2024-02-20", patient_id="P2"),
+    ]
+    assert grouping(streaming(incomings)) == grouping(sequential(incomings))
+
+
+def test_bulk_reuses_existing_cases_like_sequential():
+    falldatenprodukt = pd.DataFrame({
+        "case_ID": ["C-old", "C-other"],
+        "Patient_ID": ["P1", "P2"],
+        "Pathogen_code": ["A1", "A1"],
+        "Date": pd.to_datetime(["2024-01-01", "2024-01-01"]),
+    })
+    fall_meldung_tabelle = pd.DataFrame({"ID": ["M-0", "M-9"], "case_ID": ["C-old", "C-other"]})
+    # M-2 is nearer to the case M-1 opens than to C-old, so it must join that one
+    incomings = [incoming("M-1", "2024-02-10"), incoming("M-2", "2024-01-25"), incoming("M-3", "2024-01-10")]
+
+    seq_fall, seq_links = falldatenprodukt.copy(), fall_meldung_tabelle.copy()
+    expected = [upsert_case_and_link_id(i, seq_fall, seq_links) for i in incomings]
+
+    case_ids, bulk_fall, bulk_links = upsert_cases_bulk(incomings, falldatenprodukt, fall_meldung_tabelle)
+
+    assert case_ids[2] == expected[2] == "C-old"
+    assert case_ids[0] == case_ids[1] and expected[0] == expected[1]
+    assert len(bulk_fall) == len(seq_fall) == 3
+    assert len(bulk_links) == len(seq_links) == 5
@@ -0,0 +1,96 @@
+"""
+Unit tests for the case repository's bulk add.
+Runs the SQLAlchemy repository against an in-memory SQLite database.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import clear_mappers, sessionmaker
+
+from case.adapters import orm
+from case.adapters.repository import AbstractRepository, SqlAlchemyRepository
+from case.domain.domain import CaseRecord
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    orm.metadata.create_all(engine)
+    orm.start_mappers()
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    clear_mappers()
+
+
+def make_case(patient_id, case_date="2024-01-01"):
+    return CaseRecord(
+        case_id=None,
+        patient_id=patient_id,
+        case_date=case_date,
+        case_class="confirmed",
+        case_status="open",
+        pathogen="840539006",
+        canton="ZH",
+    )
+
+
+class FakeRepository(AbstractRepository):
+    def __init__(self):
+        super().__init__()
+        self.added = []
+
+    def _add(self, case):
+        self.added.append(case)
+
+    def _get(self, case_id):
+        return next((case for case in self.added if case.case_id == case_id), None)
+
+    def _get_cases_by_patient_and_pathogen(self, patient_id, pathogen_code):
+        return [case for case in self.added if case.patient_id == patient_id and case.pathogen == pathogen_code]
+
+
+def test_add_many_falls_back_to_add_per_case():
+    repo = FakeRepository()
+    cases = [make_case("1"), make_case("2")]
+
+    assert repo.add_many(cases) == [None, None]
+    assert repo.added == cases
+    assert list(repo.seen.values()) == cases
+
+
+def test_add_many_of_nothing_is_a_no_op(session):
+    repo = SqlAlchemyRepository(session)
+
+    assert repo.add_many([]) == []
+    assert repo.seen == {}
+
+
+def test_add_many_inserts_rows_and_returns_their_ids(session):
+    repo = SqlAlchemyRepository(session)
+    cases = [make_case("1"), make_case("2", "2024-02-01"), make_case("3")]
+
+    case_ids = repo.add_many(cases)
+    session.commit()
+
+    assert len(set(case_ids)) == 3
+    assert None not in case_ids
+    assert case_ids == [case.case_id for case in cases]
+    rows = session.execute(orm.cases.select().order_by(orm.cases.c.case_id)).all()
+    assert [(row.case_id, row.patient_id, row.case_date) for row in rows] == [
+        (case_ids[0], "1", "2024-01-01"),
+        (case_ids[1], "2", "2024-02-01"),
+        (case_ids[2], "3", "2024-01-01"),
+    ]
+
+
+def test_add_many_tracks_the_session_attached_instances(session):
+    repo = SqlAlchemyRepository(session)
+    cases = [make_case("1"), make_case("2")]
+
+    case_ids = repo.add_many(cases)
+
+    assert list(repo.seen.values()) == cases
+    assert all(case in session for case in cases)
+    assert repo.get(case_ids[0]) is cases[0]
+    assert len(repo.seen) == 2
@@ -0,0 +1,73 @@
+"""
+Unit tests for the async event dispatch of the FHIR ingestion message bus.
+Tests that concurrent event handlers never share a unit of work.
+"""
+
+import asyncio
+from datetime import datetime
+
+from fhir_ingestion.domain.events import BundleStored
+from fhir_ingestion.service_layer import messagebus
+
+
+class FakeUnitOfWork:
+    """Minimal unit of work that records the events handlers add to it."""
+
+    def __init__(self):
+        self.events = []
+
+    def collect_new_events(self):
+        events = self.events
+        self.events = []
+        return events
+
+
+def make_event(bundle_id="bundle-1"):
+    return BundleStored(
+        bundle_id=bundle_id,
+        object_key=f"bundles/{bundle_id}.json",
+        stored_at=datetime(2024, 1, 1),
+        bundle_type="4241000179101",
+        source_system="test-system",
+    )
+
+
+def test_each_event_handler_gets_its_own_unit_of_work(monkeypatch):
+    seen_uows = []
+
+    def recording_handler(event, uow):
+        seen_uows.append(uow)
+
+    def failing_handler(event, uow):
+        seen_uows.append(uow)
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(
+        messagebus, "EVENT_HANDLERS", {BundleStored: (recording_handler, failing_handler)}
+    )
+    shared_uow = FakeUnitOfWork()
+
+    async def run():
+        events = [make_event("bundle-1"), make_event("bundle-2")]
+        return await messagebus.handle_events_async(events, shared_uow, asyncio.Semaphore(4))
+
+    assert asyncio.run(run()) == []
+    assert len(seen_uows) == 4
+    assert len({id(uow) for uow in seen_uows}) == 4
+    assert all(isinstance(uow, FakeUnitOfWork) and uow is not shared_uow for uow in seen_uows)
+
+
+def test_events_raised_by_handlers_are_returned(monkeypatch):
+    follow_up = make_event("follow-up")
+
+    def raising_handler(event, uow):
+        uow.events.append(follow_up)
+
+    monkeypatch.setattr(messagebus, "EVENT_HANDLERS", {BundleStored: (raising_handler,)})
+
+    async def run():
+        return await messagebus.handle_events_async(
+            [make_event()], FakeUnitOfWork(), asyncio.Semaphore(1)
+        )
+
+    assert asyncio.run(run()) == [follow_up]
@@ -1,7 +1,12 @@
 """Unit tests for FHIR transformer"""
-from lab_dp.adapters.fhir_transformer import FHIRTransformer, FHIRTransformationError
+from io import BytesIO
+
+import orjson
 import pytest
 
+from lab_dp.adapters.fhir_client import iter_bundle_items
+from lab_dp.adapters.fhir_transformer import FHIRTransformer, FHIRTransformationError
+
 
 def test_extract_lab_data_product_from_bundle():
     """Test extracting lab data from a minimal FHIR bundle"""
@@ -46,3 +51,54 @@ def test_transform_fails_without_patient():
 
     with pytest.raises(FHIRTransformationError):
         FHIRTransformer.extract_lab_data_product(bundle, "bundle-123")
+
+
+def test_patient_falls_back_to_diagnostic_report_subject():
+    """Test patient ID and timestamp come from the DiagnosticReport when no Patient identifier exists"""
+    bundle = {
+        "resourceType": "Bundle",
+        "timestamp": "2024-01-15T10:30:00Z",
+        "entry": [
+            {"resource": {"resourceType": "Patient", "identifier": []}},
+            {
+                "resource": {
+                    "resourceType": "DiagnosticReport",
+                    "subject": {"reference": "Patient/patient-456"},
+                    "effectiveDateTime": "2024-01-14T08:00:00Z"
+                }
+            }
+        ]
+    }
+
+    product = FHIRTransformer.extract_lab_data_product(bundle, "bundle-456")
+
+    assert product.patient_id == "patient-456"
+    assert product.timestamp == "2024-01-14T08:00:00Z"
+    assert product.pathogen_code == "UNKNOWN"
+
+
+def test_extract_from_stream_matches_dict_extraction():
+    """Test extracting from an incrementally parsed bundle gives the same product as from the dict"""
+    bundle = {
+        "resourceType": "Bundle",
+        "entry": [
+            {"resource": {"resourceType": "DiagnosticReport", "subject": {"reference": "Patient/patient-789"}}},
+            {
+                "resource": {
+                    "resourceType": "Observation",
+                    "code": {"coding": [{"code": "697-3", "display": "Neisseria gonorrhoeae"}]},
+                    "valueQuantity": {"value": 1.5}
+                }
+            }
+        ],
+        # Top-level fields after "entry" are still picked up
+        "timestamp": "2024-01-15T10:30:00Z"
+    }
+
+    items = iter_bundle_items(BytesIO(orjson.dumps(bundle)))
+    streamed = FHIRTransformer.extract_from_stream(items, "bundle-789")
+    expected = FHIRTransformer.extract_lab_data_product(bundle, "bundle-789")
+
+    assert streamed.patient_id == expected.patient_id == "patient-789"
+    assert streamed.timestamp == expected.timestamp == "2024-01-15T10:30:00Z"
+    assert streamed.pathogen_code == expected.pathogen_code == "697-3"
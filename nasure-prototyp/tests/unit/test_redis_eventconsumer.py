@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import Mock, patch
-from lab_dp.entrypoints.redis_eventconsumer import is_laborbericht, handle_bundle_stored
+from lab_dp.entrypoints.redis_eventconsumer import is_laborbericht, handle_bundle_stored, handle_bundle_stored_batch
 
 
 class TestIsLaborbericht:
@@ -107,3 +107,34 @@ class TestHandleBundleStoredFiltering:
 
         # Should have processed the bundle
         mock_messagebus.handle.assert_called_once()
+
+
+class TestHandleBundleStoredBatch:
+    """Test that handle_bundle_stored_batch dispatches one batch of Laborbericht commands."""
+
+    @patch('lab_dp.entrypoints.redis_eventconsumer.messagebus')
+    @patch('lab_dp.entrypoints.redis_eventconsumer.SqlAlchemyUnitOfWork')
+    def test_dispatches_only_laborbericht_bundles(self, mock_uow, mock_messagebus):
+        """Test that invalid and non-Laborbericht messages are dropped from the batch."""
+        messages = [
+            {"data": b'{"bundle_id": "lab-1", "bundle_type": ["4241000179101", "Laborbericht"]}'},
+            {"data": b'{"bundle_id": "other", "bundle_type": ["9999999999999", "Other Report"]}'},
+            {"data": b'not json'},
+            {"data": b'{"bundle_id": "lab-2", "bundle_type": ["4241000179101", "Laborbericht"]}'},
+        ]
+
+        handle_bundle_stored_batch(messages)
+
+        mock_uow.assert_called_once()
+        mock_messagebus.handle_many.assert_called_once()
+        cmds = mock_messagebus.handle_many.call_args[0][0]
+        assert [cmd.bundle_id for cmd in cmds] == ["lab-1", "lab-2"]
+
+    @patch('lab_dp.entrypoints.redis_eventconsumer.messagebus')
+    @patch('lab_dp.entrypoints.redis_eventconsumer.SqlAlchemyUnitOfWork')
+    def test_skips_batch_without_laborbericht(self, mock_uow, mock_messagebus):
+        """Test that no unit of work is opened when nothing in the batch qualifies."""
+        handle_bundle_stored_batch([{"data": b'{"bundle_id": "x", "bundle_type": null}'}])
+
+        mock_uow.assert_not_called()
+        mock_messagebus.handle_many.assert_not_called()
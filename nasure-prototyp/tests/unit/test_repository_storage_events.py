@@ -180,4 +180,115 @@ class TestMinIORepositoryStorageEvents:
         assert object_name.endswith(".json")
 
         # Bundle.store should have been called with the same key
-        bundle.store.assert_called_once_with(object_name)
\ No newline at end of file
+        bundle.store.assert_called_once_with(object_name)
+
+    def test_minio_storage_length_is_byte_length_for_non_ascii(self):
+        """
+        Test that put_object gets the UTF-8 byte length, not the character count.
+        """
+        # Arrange
+        mock_client = Mock()
+        mock_client.bucket_exists.return_value = True
+
+        repository = MinIORepository(mock_client, "test-bucket")
+
+        bundle = FhirBundle(
+            bundle_id="umlaut-1",
+            bundle_data={"resourceType": "Bundle", "note": "Zürich Spital"},
+            bundle_type="test-type",
+            source_system="test-system"
+        )
+
+        # Act
+        repository.add(bundle)
+
+        # Assert
+        put_call = mock_client.put_object.call_args[1]
+        payload = put_call['data'].getvalue()
+        assert put_call['length'] == len(payload)
+        assert json.loads(payload.decode('utf-8'))["note"] == "Zürich Spital"
+
+    def test_object_keys_are_unique_within_the_same_second(self):
+        """
+        Test that storing the same bundle twice in quick succession yields distinct keys.
+        """
+        # Arrange
+        mock_client = Mock()
+        mock_client.bucket_exists.return_value = True
+
+        repository = MinIORepository(mock_client, "test-bucket")
+
+        bundle = FhirBundle(
+            bundle_id="repeat-1",
+            bundle_data={"resourceType": "Bundle"},
+            bundle_type="test-type",
+            source_system="test-system"
+        )
+
+        # Act
+        first_key = repository.add(bundle)
+        second_key = repository.add(bundle)
+
+        # Assert
+        assert first_key != second_key
+        assert first_key.endswith("_repeat-1.json")
+
+    def test_minio_storage_content_is_compact_json(self):
+        """
+        Test that bundles are stored without pretty-printing whitespace.
+        """
+        # Arrange
+        mock_client = Mock()
+        mock_client.bucket_exists.return_value = True
+
+        repository = MinIORepository(mock_client, "test-bucket")
+
+        bundle_data = {"resourceType": "Bundle", "entry": [{"resource": {"resourceType": "Patient"}}]}
+        bundle = FhirBundle(
+            bundle_id="compact-1",
+            bundle_data=bundle_data,
+            bundle_type="test-type",
+            source_system="test-system"
+        )
+
+        # Act
+        repository.add(bundle)
+
+        # Assert
+        payload = mock_client.put_object.call_args[1]['data'].getvalue()
+        assert payload == json.dumps(bundle_data, separators=(",", ":")).encode("utf-8")
+
+class TestMinIORepositoryBundleIndex:
+    """Test the bundle_id -> object_key index used for lookups by ID."""
+
+    def test_add_indexes_object_key_and_lookup_skips_list(self):
+        """
+        Test that a stored bundle is found via the index without listing the bucket.
+        """
+        # Arrange
+        mock_client = Mock()
+        mock_client.bucket_exists.return_value = True
+        index = {}
+        mock_index = Mock()
+        mock_index.hset.side_effect = lambda key, field, value: index.__setitem__(field, value.encode())
+        mock_index.hget.side_effect = lambda key, field: index.get(field)
+
+        repository = MinIORepository(mock_client, "test-bucket", index=mock_index)
+        repository._get = Mock(return_value={"resourceType": "Bundle"})
+
+        bundle = FhirBundle(
+            bundle_id="indexed-1",
+            bundle_data={"resourceType": "Bundle"},
+            bundle_type="test-type",
+            source_system="test-system"
+        )
+
+        # Act
+        object_key = repository.add(bundle)
+        bundle_data = repository.get_by_bundle_id("indexed-1")
+
+        # Assert
+        assert bundle_data == {"resourceType": "Bundle"}
+        repository._get.assert_called_once_with(object_key)
+        mock_client.list_objects.assert_not_called()
+